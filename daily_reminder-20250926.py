@@ -4,27 +4,70 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 import datetime
-import json
+import bisect
+import copy
+import functools
+import importlib
+import importlib.util
 import os
 import sys
+import shutil
+import tempfile
 import threading
-import glob
+import time
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import queue
+import re
+from operator import itemgetter
 from tkinter import font
 
 # 可选依赖项处理
 try:
-    from PIL import Image, ImageDraw
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+    import orjson
+    _JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS
+    _JSONDecodeError = orjson.JSONDecodeError
+    _JSONEncodeError = orjson.JSONEncodeError
 
-try:
-    import pystray
-    from pystray import MenuItem as item
-    PYSTRAY_AVAILABLE = True
+    def _dumps(obj):
+        return orjson.dumps(obj, option=_JSON_OPTIONS)
+
+    _loads = orjson.loads
 except ImportError:
-    PYSTRAY_AVAILABLE = False
+    import json
+    _JSONDecodeError = json.JSONDecodeError
+    _JSONEncodeError = TypeError
+
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=4).encode("utf-8")
+
+    _loads = json.loads
+
+# 体积较大的可选依赖延迟到首次使用时再导入，启动时只检查是否已安装
+_LAZY_MODULES = {}
+
+def _module_available(name):
+    """检查模块是否已安装（不执行导入）"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+def _lazy_import(name):
+    """首次调用时导入模块并缓存，导入失败返回 None（同样缓存，避免重复尝试）"""
+    if name not in _LAZY_MODULES:
+        try:
+            _LAZY_MODULES[name] = importlib.import_module(name)
+        except ImportError as e:
+            logging.warning(f"Optional module {name} failed to import: {e}")
+            _LAZY_MODULES[name] = None
+    return _LAZY_MODULES[name]
+
+PIL_AVAILABLE = _module_available("PIL")
+PYSTRAY_AVAILABLE = _module_available("pystray")
+EXCEL_AVAILABLE = _module_available("openpyxl")
+DATEUTIL_AVAILABLE = _module_available("dateutil")
+SCREENINFO_AVAILABLE = _module_available("screeninfo")
 
 try:
     from tkcalendar import DateEntry
@@ -33,25 +76,6 @@ except ImportError:
     DateEntry = None
     CALENDAR_AVAILABLE = False
 
-try:
-    import openpyxl
-    EXCEL_AVAILABLE = True
-except ImportError:
-    openpyxl = None
-    EXCEL_AVAILABLE = False
-
-try:
-    from dateutil.parser import parse as date_parse
-    DATEUTIL_AVAILABLE = True
-except ImportError:
-    DATEUTIL_AVAILABLE = False
-
-try:
-    from screeninfo import get_monitors
-    SCREENINFO_AVAILABLE = True
-except ImportError:
-    SCREENINFO_AVAILABLE = False
-
 # -------------------- 全局配置 --------------------
 HOME = os.path.expanduser("~")
 SAVE_DIR = os.path.join(HOME, "DailyReminderData")
@@ -62,6 +86,8 @@ ACT_FILE = os.path.join(SAVE_DIR, "activation.json")
 LOG_FILE = os.path.join(SAVE_DIR, "app.log")
 
 TRIAL_DAYS = 7
+SAVE_DELAY_MS = 500   # 数据修改后延迟写盘的时间（毫秒），期间的修改合并为一次写入
+BACKUP_MAX_AGE = 24 * 3600   # 备份文件超过该时长（秒）才重新备份
 ACTIVATION_KEY = "YKJ-2025-KEY"
 MAX_AGE = 100
 
@@ -98,87 +124,194 @@ COLORS = {
 }
 
 # 默认数据
-default_data = {
-    "work_plan": {str(i): f"周{i+1}：待填写工作内容" for i in range(7)},
-    "shipping_orders": {},
-    "pre_shipping_orders": {},
-    "reminder_enabled": True,
-    "reminder_interval": 120,
-    "startup_enabled": False,
-    "excel_dir": os.path.join(SAVE_DIR, "orders_import"),
-    "life_settings": {"current_age": 25, "ideal_age": 80},
-    "festival_reminders": {"01-01": "元旦", "02-14": "情人节", "05-01": "劳动节", "10-01": "国庆节"},
-    "clock_settings": {
-        "clock_in_enabled": False,
-        "clock_out_enabled": False,
-        "clock_in_time": "09:00",
-        "clock_out_time": "18:00",
-        "clock_in_message": "上班时间到了，记得打卡哦！",
-        "clock_out_message": "下班时间到了，记得打卡哦！"
-    },
-    "custom_reminders": []
-}
+DEFAULT_EXCEL_DIR = os.path.join(SAVE_DIR, "orders_import")
+_WORK_PLAN_TEMPLATE = tuple((str(i), f"周{i+1}：待填写工作内容") for i in range(7))
+
+def _make_default():
+    """生成一份全新的默认数据，嵌套结构互不共享"""
+    return {
+        "work_plan": dict(_WORK_PLAN_TEMPLATE),
+        "shipping_orders": {},
+        "pre_shipping_orders": {},
+        "reminder_enabled": True,
+        "reminder_interval": 120,
+        "startup_enabled": False,
+        "excel_dir": DEFAULT_EXCEL_DIR,
+        "life_settings": {"current_age": 25, "ideal_age": 80},
+        "festival_reminders": {"01-01": "元旦", "02-14": "情人节", "05-01": "劳动节", "10-01": "国庆节"},
+        "clock_settings": {
+            "clock_in_enabled": False,
+            "clock_out_enabled": False,
+            "clock_in_time": "09:00",
+            "clock_out_time": "18:00",
+            "clock_in_message": "上班时间到了，记得打卡哦！",
+            "clock_out_message": "下班时间到了，记得打卡哦！"
+        },
+        "custom_reminders": []
+    }
 
-os.makedirs(default_data["excel_dir"], exist_ok=True)
+os.makedirs(DEFAULT_EXCEL_DIR, exist_ok=True)
 
 # 全局变量
 app = None
 
-# 设置日志
+# JSON 文件解析缓存：(路径, mtime_ns, 大小) -> 解析结果
+_DATA_CACHE = {}
+
+# 串行化所有数据文件写入（后台保存线程与同步保存共用）
+_SAVE_LOCK = threading.Lock()
+
+# 设置日志（设置环境变量 DAILY_REMINDER_DEBUG 时输出调试日志）
 logging.basicConfig(
     filename=LOG_FILE,
-    level=logging.INFO,
+    level=logging.DEBUG if os.environ.get("DAILY_REMINDER_DEBUG") else logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
     encoding="utf-8"
 )
 
 # -------------------- 数据管理 --------------------
+def _cache_key(path):
+    """根据文件状态生成缓存键，文件不存在时返回 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size)
+
+def _cache_get(key):
+    """命中缓存时返回解析结果的深拷贝，调用方可以随意修改"""
+    if key is None:
+        return None
+    cached = _DATA_CACHE.get(key)
+    return copy.deepcopy(cached) if cached is not None else None
+
+def _cache_put(key, value):
+    """写入缓存并清理同一文件的旧条目"""
+    if key is None:
+        return
+    _cache_invalidate(key[0])
+    _DATA_CACHE[key] = copy.deepcopy(value)
+
+def _cache_invalidate(path):
+    """使指定文件的缓存失效"""
+    for key in [k for k in _DATA_CACHE if k[0] == path]:
+        _DATA_CACHE.pop(key, None)
+
+def _normalize_orders(data):
+    """统一订单条目格式，刷新表格时无需再逐行判断类型
+
+    发货订单为 {"order", "remark"}，预备订单为 {"order", "done", "remark"}；
+    旧版本保存的纯字符串条目会被转换。
+    """
+    for key, fields in (("shipping_orders", {"remark": ""}),
+                        ("pre_shipping_orders", {"done": False, "remark": ""})):
+        for date_iso, items in data.get(key, {}).items():
+            for i, item in enumerate(items):
+                if not isinstance(item, dict):
+                    item = items[i] = {"order": str(item)}
+                item.setdefault("order", "")
+                for field, default in fields.items():
+                    item.setdefault(field, default)
+
+# 自定义提醒字段及默认值，load_data 时补齐，读取时可直接下标访问
+_REMINDER_DEFAULTS = {"time": "", "content": "", "enabled": True, "date_type": "daily", "specific_date": ""}
+_reminder_fields = itemgetter("time", "content", "enabled", "date_type", "specific_date")
+
+def _normalize_custom_reminders(data):
+    """为旧版本保存的自定义提醒补齐缺失字段"""
+    for reminder in data.get("custom_reminders", []):
+        for field, default in _REMINDER_DEFAULTS.items():
+            reminder.setdefault(field, default)
+
 def load_data():
     """加载数据"""
+    key = _cache_key(DATA_FILE)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
     if os.path.exists(DATA_FILE):
         try:
-            with open(DATA_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                for key, value in default_data.items():
-                    if key not in data:
-                        data[key] = value
-                return data
-        except json.JSONDecodeError as e:
+            with open(DATA_FILE, "rb") as f:
+                data = _loads(f.read())
+            for k, value in _make_default().items():
+                if k not in data:
+                    data[k] = value
+            _normalize_orders(data)
+            _normalize_custom_reminders(data)
+            _cache_put(key, data)
+            return data
+        except _JSONDecodeError as e:
             logging.error(f"JSON decode error loading data: {e}")
-            return default_data.copy()
+            return _make_default()
         except Exception as e:
             logging.error(f"Failed to load data: {e}")
-            return default_data.copy()
+            return _make_default()
     else:
-        return default_data.copy()
+        return _make_default()
+
+def _write_data_file(d):
+    """原子写入数据文件：先写临时文件再替换，调用方需持有 _SAVE_LOCK"""
+    payload = _dumps(d)
+    _cache_invalidate(DATA_FILE)
+    _rotate_backup()
+    fd, tmp = tempfile.mkstemp(dir=SAVE_DIR, prefix=".data.", suffix=".json")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, DATA_FILE)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
 
-def save_data(d):
-    """保存数据"""
+def _rotate_backup():
+    """每天最多备份一次当前数据文件（保留覆盖前的版本）"""
+    backup = DATA_FILE + ".backup"
     try:
-        if os.path.exists(DATA_FILE):
-            backup_file = DATA_FILE + ".backup"
-            import shutil
-            shutil.copy(DATA_FILE, backup_file)
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(d, f, ensure_ascii=False, indent=4)
-    except PermissionError:
+        if not os.path.exists(DATA_FILE):
+            return
+        if os.path.exists(backup) and time.time() - os.path.getmtime(backup) < BACKUP_MAX_AGE:
+            return
+        shutil.copy(DATA_FILE, backup)
+    except OSError as e:
+        logging.error(f"Failed to back up data file: {e}")
+
+def _report_save_error(e):
+    """记录保存失败的日志并弹出错误提示，需在主线程调用"""
+    if isinstance(e, PermissionError):
         logging.error(f"Permission denied saving data to {DATA_FILE}")
         messagebox.showerror("Error", f"No permission to save data to {DATA_FILE}")
-    except json.JSONEncodeError as e:
+    elif isinstance(e, _JSONEncodeError):
         logging.error(f"JSON encode error saving data: {e}")
         messagebox.showerror("Error", "Data format error, cannot save")
-    except Exception as e:
+    else:
         logging.error(f"Failed to save data: {e}")
         messagebox.showerror("Error", f"Failed to save data: {e}")
 
+def save_data(d):
+    """保存数据"""
+    try:
+        with _SAVE_LOCK:
+            _write_data_file(d)
+    except Exception as e:
+        _report_save_error(e)
+
 # -------------------- 激活管理 --------------------
 def load_activation():
     """加载激活信息"""
+    key = _cache_key(ACT_FILE)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
     if os.path.exists(ACT_FILE):
         try:
-            with open(ACT_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            with open(ACT_FILE, "rb") as f:
+                act_data = _loads(f.read())
+            _cache_put(key, act_data)
+            return act_data
+        except _JSONDecodeError as e:
             logging.error(f"JSON decode error loading activation: {e}")
             return {}
         except Exception as e:
@@ -188,13 +321,74 @@ def load_activation():
 
 def save_activation(act_data):
     """保存激活信息"""
+    _cache_invalidate(ACT_FILE)
     try:
-        with open(ACT_FILE, "w", encoding="utf-8") as f:
-            json.dump(act_data, f, ensure_ascii=False, indent=4)
+        with open(ACT_FILE, "wb") as f:
+            f.write(_dumps(act_data))
     except Exception as e:
         logging.error(f"Failed to save activation: {e}")
 
-def check_trial(parent=None):
+@functools.lru_cache(maxsize=256)
+def _parse_iso_date(value):
+    """解析 ISO 日期字符串并缓存结果，格式无效时返回 None"""
+    try:
+        return datetime.date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+# 用户输入的日期必须是 YYYY-MM-DD；fromisoformat 在 3.11 起也接受 "20250921" 等写法，
+# 这类写法作为订单日期键会打乱按字符串排序，先用正则挡掉
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+def _parse_user_date(text):
+    """解析用户输入的 YYYY-MM-DD 日期，格式不符或日期无效时返回 None，不抛异常"""
+    if _ISO_DATE_RE.fullmatch(text):
+        return _parse_iso_date(text)
+    return None
+
+@functools.lru_cache(maxsize=64)
+def _parse_hhmm(time_str):
+    """解析 "HH:MM" 为 (时, 分) 并缓存，格式无效时抛出 ValueError"""
+    hour, minute = map(int, time_str.split(':'))
+    return hour, minute
+
+def _delay_ms_until(target_time, now):
+    """距目标时刻的毫秒数（向上取整）
+
+    after 不会早于给定延迟触发，向上取整保证回调运行时已到达目标时刻，
+    重新安排时按当前时间计算会落到下一次，不会在目标前几毫秒重复触发。
+    """
+    return -((now - target_time) // datetime.timedelta(milliseconds=1))
+
+def _trial_days_left(act_data, today=None):
+    """试用剩余天数；试用开始日期缺失或无效时按完整试用期计算"""
+    start_date = _parse_iso_date(act_data.get("trial_start"))
+    if start_date is None:
+        return TRIAL_DAYS
+    return max(TRIAL_DAYS - ((today or datetime.date.today()) - start_date).days, 0)
+
+# 托盘图标颜色（RGBA）
+_TRAY_FILL = (33, 150, 243, 255)
+_TRAY_OUTLINE = (25, 118, 210, 255)
+_TRAY_DOT = (255, 255, 255, 255)
+
+@functools.lru_cache(maxsize=4)
+def _draw_tray_image(size):
+    """绘制托盘图标并按尺寸缓存，图标是静态的，每次最小化到托盘都复用同一张图"""
+    pil_image = _lazy_import("PIL.Image")
+    pil_draw = _lazy_import("PIL.ImageDraw")
+    if pil_image is None or pil_draw is None:
+        return None
+    image = pil_image.new('RGBA', (size, size), (0, 0, 0, 0))
+    d = pil_draw.Draw(image)
+    
+    d.ellipse([4, 4, size-4, size-4], fill=_TRAY_FILL, outline=_TRAY_OUTLINE, width=2)
+    
+    d.ellipse([size/2-8, size/2-8, size/2+8, size/2+8], fill=_TRAY_DOT)
+    
+    return image
+
+def check_trial(parent=None, today=None):
     """检查试用状态"""
     act_data = load_activation()
     if act_data.get("activated"):
@@ -206,14 +400,13 @@ def check_trial(parent=None):
         save_activation(act_data)
         return True
     
-    try:
-        start_date = datetime.date.fromisoformat(start)
-    except ValueError:
+    start_date = _parse_iso_date(start)
+    if start_date is None:
         act_data["trial_start"] = datetime.date.today().isoformat()
         save_activation(act_data)
         return True
     
-    days_used = (datetime.date.today() - start_date).days
+    days_used = ((today or datetime.date.today()) - start_date).days
     if days_used < TRIAL_DAYS:
         return True
     else:
@@ -258,35 +451,44 @@ def set_startup(enable: bool):
         logging.error(f"Failed to set startup: {e}")
 
 # -------------------- UI工具函数 --------------------
+# 已注册 ModernButton 悬停绑定的 Tcl 解释器
+_MODERN_BUTTON_INTERPS = set()
+
+def _modern_button_hover(event, hover):
+    """ModernButton 共用的悬停处理，颜色保存在按钮属性上"""
+    btn = event.widget
+    btn.config(bg=btn._hover_bg if hover else btn._normal_bg)
+
+# 按钮类型颜色定义
+BUTTON_COLORS = {
+    "primary": COLORS["primary"],
+    "success": COLORS["success"], 
+    "warning": COLORS["warning"],
+    "error": COLORS["error"],
+    "secondary": COLORS["secondary"],
+    "accent": COLORS["accent"]
+}
+
+# 按钮类型悬停颜色
+BUTTON_HOVER_COLORS = {
+    "primary": COLORS["primary_dark"],
+    "success": "#059669",  # 深绿色
+    "warning": "#D97706",  # 深橙色
+    "error": "#DC2626",    # 深红色
+    "secondary": "#D97706", # 深橙色
+    "accent": "#7C3AED"     # 深紫色
+}
+
 def create_modern_button(parent, text, command=None, bg_color=None, width=None, font_size=9, button_type="primary"):
     """创建统一现代化按钮"""
-    # 按钮类型颜色定义
-    button_colors = {
-        "primary": COLORS["primary"],
-        "success": COLORS["success"], 
-        "warning": COLORS["warning"],
-        "error": COLORS["error"],
-        "secondary": COLORS["secondary"],
-        "accent": COLORS["accent"]
-    }
-    
-    # 按钮类型悬停颜色
-    hover_colors = {
-        "primary": COLORS["primary_dark"],
-        "success": "#059669",  # 深绿色
-        "warning": "#D97706",  # 深橙色
-        "error": "#DC2626",    # 深红色
-        "secondary": "#D97706", # 深橙色
-        "accent": "#7C3AED"     # 深紫色
-    }
-    
+    hover_bg = BUTTON_HOVER_COLORS.get(button_type, COLORS["primary_dark"])
     if bg_color is None:
-        bg_color = button_colors.get(button_type, COLORS["primary"])
+        bg_color = BUTTON_COLORS.get(button_type, COLORS["primary"])
     
     # 统一按钮样式
     btn = tk.Button(parent, text=text, command=command,
                     bg=bg_color, fg="white",
-                    activebackground=hover_colors.get(button_type, COLORS["primary_dark"]),
+                    activebackground=hover_bg,
                     relief="flat", borderwidth=0,
                     font=FONTS["button"],
                     cursor="hand2", 
@@ -297,16 +499,124 @@ def create_modern_button(parent, text, command=None, bg_color=None, width=None,
     if width:
         btn.config(width=width)
     
-    # 悬停效果
-    def on_enter(e):
-        btn.config(bg=hover_colors.get(button_type, COLORS["primary_dark"]))
-    def on_leave(e):
-        btn.config(bg=bg_color)
-    
-    btn.bind("<Enter>", on_enter)
-    btn.bind("<Leave>", on_leave)
+    # 悬停效果：所有按钮共用一组类绑定，不再为每个按钮创建回调
+    btn._normal_bg = bg_color
+    btn._hover_bg = hover_bg
+    if btn.tk not in _MODERN_BUTTON_INTERPS:
+        btn.bind_class("ModernButton", "<Enter>", lambda e: _modern_button_hover(e, True))
+        btn.bind_class("ModernButton", "<Leave>", lambda e: _modern_button_hover(e, False))
+        _MODERN_BUTTON_INTERPS.add(btn.tk)
+    btn.bindtags((str(btn), "ModernButton") + btn.bindtags()[1:])
     return btn
 
+_STYLES_CONFIGURED = False
+_ROW_TAGS = ("evenrow", "oddrow")
+
+def _configure_ttk_styles_once():
+    """配置表格使用的全局 ttk 样式（主题和 Treeview 样式），整个程序只执行一次"""
+    global _STYLES_CONFIGURED
+    if _STYLES_CONFIGURED:
+        return
+    _STYLES_CONFIGURED = True
+    try:
+        # 创建样式对象
+        style = ttk.Style()
+        # 尝试使用不同的主题来显示网格线
+        try:
+            style.theme_use('vista')  # Vista主题通常有更好的网格线支持
+        except:
+            try:
+                style.theme_use('winnative')  # Windows原生主题
+            except:
+                style.theme_use('clam')  # 回退到clam主题
+        
+        # 设置简洁样式
+        style.configure("Treeview",
+                      font=("Microsoft YaHei UI", 9),
+                      background="white",
+                      foreground="#1F2937",
+                      fieldbackground="white",
+                      relief="flat",
+                      borderwidth=0,
+                      show="tree headings")
+        
+        style.configure("Treeview.Heading",
+                      font=("Microsoft YaHei UI", 9, "bold"),
+                      background="#F8FAFC",
+                      foreground="#374151",
+                      relief="flat",
+                      borderwidth=0)
+        
+        # 设置单元格样式 - 简洁设计
+        style.configure("Treeview.Cell",
+                      relief="flat",
+                      borderwidth=0,
+                      background="white",
+                      foreground="#1F2937",
+                      focuscolor="none")
+        
+        # 设置行样式 - 简洁设计
+        style.configure("Treeview.Row",
+                      relief="flat",
+                      borderwidth=0,
+                      background="white")
+        
+        # 设置列样式 - 简洁设计
+        style.configure("Treeview.Column",
+                      relief="flat",
+                      borderwidth=0)
+        
+        # 设置选中状态 - 使用更柔和的颜色
+        style.map("Treeview",
+                 background=[('selected', '#EFF6FF')],
+                 foreground=[('selected', '#1E40AF')])
+        
+        # 设置单元格映射
+        style.map("Treeview.Cell",
+                 background=[('selected', '#EFF6FF')],
+                 foreground=[('selected', '#1E40AF')])
+        logging.info("Treeview styles configured")
+    except Exception as e:
+        logging.error(f"Failed to configure ttk styles: {e}")
+
+def _fill_tree(tree, rows):
+    """用 (iid, values) 行同步 Treeview 内容，只改动与上次填充不同的部分
+
+    开头 iid 与上次填充一致的行只在值变化时更新单元格，其后的旧行删除、新行追加；
+    iid 为 None 或表格内容被其他代码改动过时退回整体重建。
+    填充期间暂停 yscrollcommand，避免每插入一行都回调滚动条。
+    """
+    rows = list(rows)
+    children = tree.get_children("")
+    prev = getattr(tree, "_filled_rows", None)
+    keep = 0
+    if (prev is not None and all(iid is not None for iid, _ in rows)
+            and [iid for iid, _ in prev] == list(children)):
+        limit = min(len(prev), len(rows))
+        while keep < limit and rows[keep][0] == prev[keep][0]:
+            keep += 1
+    
+    yscroll = tree.cget("yscrollcommand")
+    tree.configure(yscrollcommand="")
+    try:
+        for i in range(keep):
+            if rows[i][1] != prev[i][1]:
+                tree.item(rows[i][0], values=rows[i][1])
+        stale = children[keep:]
+        if stale:
+            tree.delete(*stale)
+        # 奇偶行交替底色代替手绘网格线区分各行
+        for i in range(keep, len(rows)):
+            iid, values = rows[i]
+            tags = (_ROW_TAGS[i % 2],)
+            if iid is None:
+                tree.insert("", "end", values=values, tags=tags)
+            else:
+                tree.insert("", "end", iid=iid, values=values, tags=tags)
+    finally:
+        tree.configure(yscrollcommand=yscroll)
+    tree._filled_rows = rows
+
 def create_card_frame(parent, title=None):
     """创建简洁卡片框架"""
     card = tk.Frame(parent, bg=COLORS["bg_card"], relief="flat", bd=0)
@@ -318,10 +628,22 @@ def create_card_frame(parent, title=None):
                  bg=COLORS["gradient_start"], fg=COLORS["text_primary"]).pack(pady=6)
     return card
 
+# 显示器列表缓存，避免每次居中都枚举显示器
+_MONITORS_CACHE = {"t": None, "v": None}
+MONITORS_CACHE_TTL = 5.0
+
+def _get_monitors_cached(screeninfo):
+    """返回显示器列表，结果缓存 MONITORS_CACHE_TTL 秒"""
+    now = time.monotonic()
+    if _MONITORS_CACHE["t"] is None or now - _MONITORS_CACHE["t"] > MONITORS_CACHE_TTL:
+        _MONITORS_CACHE["v"] = screeninfo.get_monitors()
+        _MONITORS_CACHE["t"] = now
+    return _MONITORS_CACHE["v"]
+
 def center_window(win, width, height):
     """将窗口居中到鼠标所在的屏幕"""
     try:
-        logging.info(f"Centering window with size {width}x{height}")
+        logging.debug("Centering window with size %sx%s", width, height)
         win.update_idletasks()  # Ensure window geometry is updated
         
         # 获取屏幕尺寸和鼠标位置
@@ -336,8 +658,9 @@ def center_window(win, width, height):
         y = (screen_height - height) // 2
         
         # 通过查找包含鼠标的显示器来调整多显示器设置
-        if SCREENINFO_AVAILABLE and sys.platform == 'win32':
-            monitors = get_monitors()
+        screeninfo = _lazy_import("screeninfo") if SCREENINFO_AVAILABLE and sys.platform == 'win32' else None
+        if screeninfo:
+            monitors = _get_monitors_cached(screeninfo)
             for monitor in monitors:
                 if (monitor.x <= mouse_x < monitor.x + monitor.width and
                     monitor.y <= mouse_y < monitor.y + monitor.height):
@@ -349,7 +672,7 @@ def center_window(win, width, height):
         win.geometry(f"{width}x{height}+{x}+{y}")
         win.deiconify()  # Ensure window is not minimized
         win.lift()  # Bring window to front
-        logging.info(f"Window centered at position ({x}, {y})")
+        logging.debug("Window centered at position (%s, %s)", x, y)
     except Exception as e:
         logging.error(f"Failed to center window: {e}")
         # 回退到基本居中
@@ -360,8 +683,69 @@ def today_str():
     """获取今天的字符串"""
     return datetime.date.today().isoformat()
 
-def compute_life_ui(data):
-    """计算生命进度UI，剩余天数每日递减。"""
+def _future_dates(orders_by_date, today, sorted_dates=None):
+    """返回不早于 today 且有订单的日期（升序）
+
+    传入已排序的全部日期 sorted_dates 时二分定位到 today，跳过所有历史日期；
+    否则只对未来日期排序。ISO 日期字符串的字典序即时间顺序。
+    """
+    if sorted_dates is not None:
+        start = bisect.bisect_left(sorted_dates, today)
+        return [d for d in sorted_dates[start:] if orders_by_date.get(d)]
+    dates = [d for d, lst in orders_by_date.items() if d >= today and lst]
+    dates.sort()
+    return dates
+
+def _ensure_life_baseline(data):
+    """缺失时初始化剩余天数的每日递减基线，有修改时返回 True"""
+    try:
+        life_settings = data.setdefault("life_settings", {})
+        if "remain_base_days" in life_settings and "remain_base_date" in life_settings:
+            return False
+        current_age_years = int(life_settings.get("current_age", 36))
+        ideal_age_years = int(life_settings.get("ideal_age", 70))
+        if ideal_age_years <= 0:
+            ideal_age_years = 80
+        life_settings["remain_base_days"] = max(ideal_age_years - current_age_years, 0) * 365
+        life_settings["remain_base_date"] = datetime.date.today().isoformat()
+        return True
+    except Exception as e:
+        logging.error(f"Failed to initialize life baseline: {e}")
+        return False
+
+@functools.lru_cache(maxsize=128)
+def _life_stage(age):
+    """根据年龄返回 (图标, 阶段名称)"""
+    if age < 12:
+        return "👶", "幼年"
+    elif age < 30:
+        return "🧑", "青年"
+    elif age < 50:
+        return "👨", "中年"
+    return "👴", "老年"
+
+@functools.lru_cache(maxsize=32)
+def _format_days(remaining_days):
+    """剩余天数显示文本，只在天数变化时重新格式化"""
+    return f"余生 {remaining_days:,} 天"
+
+@functools.lru_cache(maxsize=4)
+def _festival_index(festivals):
+    """将 (MM-DD, 名称) 元组解析为 {(月, 日): 名称}，格式无效的键跳过
+
+    以节日内容为缓存键，节日设置被修改后自然失效，无需各处手动清理。
+    """
+    index = {}
+    for k, name in festivals:
+        try:
+            mm, dd = map(int, k.split('-'))
+        except ValueError:
+            continue
+        index[(mm, dd)] = name
+    return index
+
+def compute_life_ui(data, today=None):
+    """计算生命进度UI，剩余天数每日递减（只读，不修改 data）；today 默认为当天"""
     try:
         life_settings = data.get("life_settings", {})
         current_age_years = int(life_settings.get("current_age", 36))
@@ -370,65 +754,76 @@ def compute_life_ui(data):
         if ideal_age_years <= 0:
             ideal_age_years = 80
 
-        # 如果缺失则初始化每日递减基线
-        today = datetime.date.today()
+        if today is None:
+            today = datetime.date.today()
         base_days_key = "remain_base_days"
         base_date_key = "remain_base_date"
 
-        if base_days_key not in life_settings or base_date_key not in life_settings:
-            life_settings[base_days_key] = max(ideal_age_years - current_age_years, 0) * 365
-            life_settings[base_date_key] = today.isoformat()
-            save_data(data)
-
-        # 安全解析基准日期
-        try:
-            base_date = datetime.date.fromisoformat(life_settings.get(base_date_key, today.isoformat()))
-        except ValueError:
-            base_date = today
+        # 安全解析基准日期（缺失或无效时以今天为准）
+        base_date = _parse_iso_date(life_settings.get(base_date_key)) or today
 
-        base_remaining_days = int(life_settings.get(base_days_key, 0))
+        # 基线缺失时（正常由 _ensure_life_baseline 初始化）按当前年龄计算
+        default_base = max(ideal_age_years - current_age_years, 0) * 365
+        base_remaining_days = int(life_settings.get(base_days_key, default_base))
         delta_days = (today - base_date).days
         remaining_days = max(base_remaining_days - max(delta_days, 0), 0)
 
         # 基于当前年龄的生命阶段（仅显示）
-        if current_age_years < 12:
-            stage_icon = "👶"
-            stage_text = "幼年"
-        elif current_age_years < 30:
-            stage_icon = "🧑"
-            stage_text = "青年"
-        elif current_age_years < 50:
-            stage_icon = "👨"
-            stage_text = "中年"
-        else:
-            stage_icon = "👴"
-            stage_text = "老年"
+        stage_icon, stage_text = _life_stage(current_age_years)
 
         # 使用基于天数的进度以允许平滑的每日变化
         ideal_total_days = max(ideal_age_years, 1) * 365
         elapsed_days = max(ideal_total_days - remaining_days, 0)
         value = min(max(elapsed_days / ideal_total_days, 0.0), 1.0)
 
-        return value, stage_icon, stage_text, f"余生 {remaining_days:,} 天"
+        return value, stage_icon, stage_text, _format_days(remaining_days)
     except Exception as e:
         logging.error(f"Failed to compute life UI: {e}")
         return 0.3, "🧑", "青年", "余生 20,075 天"
 
 # -------------------- Excel导入 --------------------
-def import_orders_from_excel(data):
-    """从Excel导入订单"""
-    if not EXCEL_AVAILABLE:
-        return 0
-    
-    excel_dir = data.get("excel_dir")
-    if not excel_dir or not os.path.exists(excel_dir):
-        return 0
-    
-    count = 0
-    files = glob.glob(os.path.join(excel_dir, "*.xlsx"))
-    for f in files:
+_DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M:%S",
+                 "%Y.%m.%d", "%Y%m%d", "%m/%d/%Y")
+
+def _parse_date(date_str):
+    """解析日期字符串为 date，依次尝试常见格式，全部失败时才使用 dateutil"""
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(date_str, fmt).date()
+        except ValueError:
+            pass
+    parser = _lazy_import("dateutil.parser") if DATEUTIL_AVAILABLE else None
+    if parser:
+        try:
+            return parser.parse(date_str, dayfirst=False, yearfirst=True).date()
+        except (ValueError, OverflowError):
+            pass
+    raise ValueError(f"Unrecognized date: {date_str}")
+
+def _parse_pre_iid(iid):
+    """解析预备订单行 iid，返回 (日期, 下标)；不是订单行时返回 None
+
+    支持 "pre_2025-09-21_1" 与旧格式 "2025-09-21|1"，直接切片而不拆分列表。
+    """
+    if iid.startswith("pre_"):
+        p = iid.find("_", 4)
+        start = 4
+    else:
+        p = iid.find("|")
+        start = 0
+    if p < 0:
+        return None
+    n = iid[p + 1:]
+    if not n.isdigit():
+        return None
+    return iid[start:p], int(n) - 1
+
+def _parse_excel_file(path):
+    """解析单个 Excel 文件，返回 [(key, date_iso, order), ...]，可在工作线程中调用"""
+    rows = []
+    try:
+        wb = _lazy_import("openpyxl").load_workbook(path, data_only=True, read_only=True)
         try:
-            wb = openpyxl.load_workbook(f, data_only=True)
             ws = wb.active
             for row in ws.iter_rows(min_row=2, values_only=True):
                 if not row or not row[0]:
@@ -441,13 +836,9 @@ def import_orders_from_excel(data):
                     date_str = str(date_cell).strip()
                 
                 try:
-                    if DATEUTIL_AVAILABLE:
-                        date_obj = date_parse(date_str, dayfirst=False, yearfirst=True)
-                    else:
-                        date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%d")
-                    date_iso = date_obj.date().isoformat()
+                    date_iso = _parse_date(date_str).isoformat()
                 except ValueError:
-                    logging.warning(f"Invalid date format in file {f}: {date_str}")
+                    logging.warning(f"Invalid date format in file {path}: {date_str}")
                     continue
                 
                 order = str(row[1]).strip() if len(row) > 1 and row[1] else ""
@@ -457,20 +848,100 @@ def import_orders_from_excel(data):
                     continue
                 
                 key = "shipping_orders" if "发货" in typ else "pre_shipping_orders"
-                data.setdefault(key, {}).setdefault(date_iso, [])
-                
-                if order not in data[key][date_iso]:
-                    data[key][date_iso].append(order)
-                    count += 1
-            
+                rows.append((key, date_iso, order))
+        finally:
             wb.close()
-        except Exception as e:
-            logging.error(f"Failed to read Excel file {f}: {e}")
+    except Exception as e:
+        logging.error(f"Failed to read Excel file {path}: {e}")
+    return rows
+
+def collect_orders_from_excel(excel_dir, progress=None):
+    """解析目录下所有 Excel 文件，返回每个文件的 [(key, date_iso, order), ...] 列表
+
+    不读写程序数据，可在后台线程调用；progress(done, total) 在每个文件解析完成后回调。
+    """
+    if not EXCEL_AVAILABLE or _lazy_import("openpyxl") is None:
+        return []
+    if not excel_dir or not os.path.exists(excel_dir):
+        return []
+    
+    try:
+        with os.scandir(excel_dir) as it:
+            files = sorted(e.path for e in it
+                           if e.is_file() and e.name.lower().endswith(".xlsx") and not e.name.startswith("~$"))
+    except OSError as e:
+        logging.error(f"Failed to list Excel directory {excel_dir}: {e}")
+        return []
+    if not files:
+        return []
+    
+    # 多个文件并行解析，结果按文件顺序返回
+    results = []
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4, len(files))) as ex:
+        for done, rows in enumerate(ex.map(_parse_excel_file, files), 1):
+            results.append(rows)
+            if progress:
+                progress(done, len(files))
+    return results
+
+def _order_label(item):
+    """提醒弹窗中的订单文本：有备注时显示为 "订单号 (备注)"，条目已由 _normalize_orders 统一"""
+    remark = item["remark"]
+    return f"{item['order']} ({remark})" if remark else item["order"]
+
+def _build_order_index(data):
+    """建立 {(key, 日期): 订单号集合} 索引，用于 O(1) 判断订单是否重复"""
+    index = {}
+    for key in ("shipping_orders", "pre_shipping_orders"):
+        for date_iso, items in data.get(key, {}).items():
+            index[(key, date_iso)] = {it["order"] for it in items}
+    return index
+
+def merge_imported_orders(data, results, seen):
+    """将解析结果合并进程序数据（需在主线程调用），返回新增订单数
+
+    seen 为 _build_order_index 建立的订单去重索引，合并时同步更新。
+    """
+    count = 0
+    for rows in results:
+        for key, date_iso, order in rows:
+            bucket = seen.setdefault((key, date_iso), set())
+            if order in bucket:
+                continue
+            bucket.add(order)
+            entry = {"order": order, "remark": ""} if key == "shipping_orders" else {"order": order, "done": False, "remark": ""}
+            data.setdefault(key, {}).setdefault(date_iso, []).append(entry)
+            count += 1
     return count
 
 # -------------------- Life Progress Canvas --------------------
+def _gradient_color(t):
+    """渐变颜色：绿 -> 黄 -> 红，t 取值 0~1"""
+    if t < 0.5:
+        return int(100 + 155*t*2), 255, 100
+    return 255, int(255 - 155*(t-0.5)*2), 100
+
+@functools.lru_cache(maxsize=32)
+def _rounded_rect_points(x1, y1, x2, y2, radius):
+    """圆角矩形多边形顶点（smooth 多边形），按参数缓存"""
+    return (x1+radius, y1,
+            x2-radius, y1,
+            x2, y1,
+            x2, y1+radius,
+            x2, y2-radius,
+            x2, y2,
+            x2-radius, y2,
+            x1+radius, y2,
+            x1, y2,
+            x1, y2-radius,
+            x1, y1+radius,
+            x1, y1)
+
 class BeautifulLifeCanvas(tk.Canvas):
     """Beautified life progress canvas"""
+    # 预先计算的 256 级渐变色表，绘制时按位置查表
+    GRADIENT_RGB = [_gradient_color(i / 255) for i in range(256)]
+    GRADIENT_HEX = [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in GRADIENT_RGB]
     def __init__(self, parent, width=700, height=70, **kwargs):
         super().__init__(parent, width=width, height=height, highlightthickness=0,
                          bg=COLORS["bg_card"], **kwargs)
@@ -481,6 +952,11 @@ class BeautifulLifeCanvas(tk.Canvas):
         self._width = width
         self._height = height
         self._radius = 15
+        self._grad_image = None   # 缓存的渐变填充图像（需保持引用防止被回收）
+        self._grad_key = None     # 渐变图像对应的 (fill_w, h)
+        self._items = {}          # 名称 -> 画布元素 id，重绘时复用已有元素
+        self._drawn_fill = None   # 画布上当前渐变填充对应的 (fill_w, h)
+        self._days_font = None    # 测量剩余天数文字宽度用的字体（首次重绘时创建）
         self.bind("<Configure>", self.on_resize)
 
     def set_values(self, value, stage_icon, stage_text, days_text):
@@ -500,81 +976,120 @@ class BeautifulLifeCanvas(tk.Canvas):
     def redraw(self):
         """Redraw canvas"""
         try:
-            self.delete("all")
+            # 所有元素都保留复用，只更新坐标和内容；渐变填充仅在尺寸变化时重建
             w = max(self.winfo_width(), self._width)
             h = max(self.winfo_height(), self._height)
             
             w = max(w, 400)
             h = max(h, 60)
             
-            logging.info("Drawing life progress bar")
-            
             # Background progress bar
-            self.create_rounded_rect(100, 12, w-130, h-12,
-                                     radius=self._radius, fill="#F5F5F5", outline="#E0E0E0", width=2)
-            logging.info("Background progress bar drawn")
+            self._upsert("bg", "polygon", _rounded_rect_points(100, 12, w-130, h-12, self._radius),
+                         smooth=True, fill="#F5F5F5", outline="#E0E0E0", width=2)
             
             # Fill progress (gradient effect)
             fill_w = int((w-230) * self._value)
-            if fill_w > 8:
-                for i in range(0, fill_w, 2):
-                    t = i / max(1, fill_w-1)
-                    if t < 0.5:
-                        r, g, b = int(100 + 155*t*2), 255, 100
-                    else:
-                        r, g, b = 255, int(255 - 155*(t-0.5)*2), 100
-                    
-                    color = f"#{r:02x}{g:02x}{b:02x}"
-                    x_pos = 100 + i
-                    if x_pos < w-130:
-                        self.create_line(x_pos, 15, x_pos, h-15, fill=color, width=2)
-            logging.info("Progress fill drawn")
+            fill_key = (fill_w, h) if fill_w > 8 else None
+            if fill_key != self._drawn_fill:
+                self.delete("grad")
+                if fill_key:
+                    self.draw_gradient(fill_w, h)
+                    # 填充紧贴在背景之上，保证文字不被遮挡
+                    self.tag_raise("grad", self._items["bg"])
+                self._drawn_fill = fill_key
             
             # 进度百分比文本
             percent_text = f"{int(self._value*100)}%"
-            self.create_text(w/2+1, h/2+1, text=percent_text, font=FONTS["large"], fill="#CCCCCC")
-            self.create_text(w/2, h/2, text=percent_text, font=FONTS["large"], fill=COLORS["text_primary"])
-            logging.info("Progress percentage drawn")
+            self._upsert("percent_shadow", "text", (w/2+1, h/2+1),
+                         text=percent_text, font=FONTS["large"], fill="#CCCCCC")
+            self._upsert("percent", "text", (w/2, h/2),
+                         text=percent_text, font=FONTS["large"], fill=COLORS["text_primary"])
             
             # 生命阶段图标和文本（固定在进度条左侧）- 简化设计
-            self.create_rounded_rect(15, 15, 85, h-15, radius=6,
-                                    fill="white", outline=COLORS["primary"], width=1)
-            self.create_text(32, h/2, text=self._stage_icon, font=FONTS["large"])
-            self.create_text(58, h/2, text=self._stage_text, font=FONTS["large"], fill=COLORS["text_primary"])
-            logging.info(f"Life stage drawn: {self._stage_icon} {self._stage_text}")
+            self._upsert("badge", "polygon", _rounded_rect_points(15, 15, 85, h-15, 6),
+                         smooth=True, fill="white", outline=COLORS["primary"], width=1)
+            self._upsert("stage_icon", "text", (32, h/2), text=self._stage_icon, font=FONTS["large"])
+            self._upsert("stage_text", "text", (58, h/2),
+                         text=self._stage_text, font=FONTS["large"], fill=COLORS["text_primary"])
             
             # 剩余天数（固定在画布最右侧，无背景）
-            text_font = font.Font(family="Microsoft YaHei UI", size=12)
-            text_width = text_font.measure(self._days_text)
+            if self._days_font is None:
+                self._days_font = font.Font(family="Microsoft YaHei UI", size=12)
+            text_width = self._days_font.measure(self._days_text)
             days_text_x = w - 15 - text_width
-            if days_text_x > 100:
-                self.create_text(days_text_x, h/2, text=self._days_text, font=FONTS["large"],
-                                 fill=COLORS["text_primary"], anchor="w")
-                logging.info(f"Remaining days drawn: {self._days_text} at x={days_text_x}")
+            self._upsert("days", "text", (days_text_x, h/2),
+                         text=self._days_text, font=FONTS["large"], fill=COLORS["text_primary"], anchor="w",
+                         state="normal" if days_text_x > 100 else "hidden")
         except Exception as e:
             logging.error(f"Failed to draw life canvas: {e}")
 
+    def _upsert(self, name, kind, coords, **options):
+        """按名称创建或更新画布元素：首次创建，之后只更新坐标和属性"""
+        item = self._items.get(name)
+        if item is None:
+            self._items[name] = getattr(self, f"create_{kind}")(*coords, **options)
+        else:
+            self.coords(item, *coords)
+            self.itemconfig(item, **options)
+
+    def draw_gradient(self, fill_w, h):
+        """绘制进度填充：有 PIL 时使用预渲染图像，否则绘制少量色带"""
+        bar_h = h - 30
+        pil_image = _lazy_import("PIL.Image") if PIL_AVAILABLE else None
+        pil_imagetk = _lazy_import("PIL.ImageTk") if pil_image else None
+        if pil_imagetk:
+            key = (fill_w, h)
+            if key != self._grad_key:
+                denom = max(1, fill_w-1)
+                lut = self.GRADIENT_RGB
+                row = pil_image.new("RGB", (fill_w, 1))
+                row.putdata([lut[i*255 // denom] for i in range(fill_w)])
+                self._grad_image = pil_imagetk.PhotoImage(row.resize((fill_w, bar_h)), master=self)
+                self._grad_key = key
+            self.create_image(100, 15, image=self._grad_image, anchor="nw", tags="grad")
+            return
+        bands = 16
+        for k in range(bands):
+            x1 = 100 + fill_w * k // bands
+            x2 = 100 + fill_w * (k+1) // bands
+            if x2 <= x1:
+                continue
+            color = self.GRADIENT_HEX[(2*k + 1) * 255 // (2*bands)]
+            self.create_rectangle(x1, 15, x2, h-15, fill=color, width=0, tags="grad")
+
     def create_rounded_rect(self, x1, y1, x2, y2, radius=10, **kwargs):
         """创建圆角矩形"""
-        points = [x1+radius, y1,
-                  x2-radius, y1,
-                  x2, y1,
-                  x2, y1+radius,
-                  x2, y2-radius,
-                  x2, y2,
-                  x2-radius, y2,
-                  x1+radius, y2,
-                  x1, y2,
-                  x1, y2-radius,
-                  x1, y1+radius,
-                  x1, y1]
-        return self.create_polygon(points, smooth=True, **kwargs)
+        return self.create_polygon(_rounded_rect_points(x1, y1, x2, y2, radius), smooth=True, **kwargs)
 
 # -------------------- 主应用程序类 --------------------
 class DailyReminderApp:
     """每日提醒应用程序"""
+    # 提醒文本中固定不变的片段
+    _WEEKDAY_NAMES = ("一", "二", "三", "四", "五", "六", "日")
+    _SEPARATOR = "=" * 50 + "\n"
+    _SECTION_WORK = "💼 今日工作安排\n"
+    # 提醒弹窗最多列出的预备发货日期数
+    _POPUP_MAX_PRE_DATES = 10
+    # refresh_order_tables 可刷新的全部表格
+    _ALL_TABLES = ('main_shipping', 'main_pre', 'control_shipping', 'control_pre')
+    # 右下角气泡提醒样式（color 为 COLORS 中的键）
+    _BUBBLE_STYLES = {
+        "clock": {"window_title": "打卡提醒", "color": "primary", "size": (300, 100), "pad": 10,
+                  "title_gap": 5, "wraplength": 280, "timeout_ms": 5000},
+        "custom": {"window_title": "自定义提醒", "color": "accent", "size": (320, 120), "pad": 12,
+                   "title_gap": 8, "wraplength": 290, "timeout_ms": 6000},
+    }
+
     def __init__(self):
         self.data = load_data()
+        if _ensure_life_baseline(self.data):
+            save_data(self.data)
+        self._order_index = _build_order_index(self.data)   # 订单去重索引，增删订单时同步维护
+        # 订单字典的直接引用（load_data 已补齐默认键），热路径上免去 self.data 的逐层查找
+        self._shipping = self.data["shipping_orders"]
+        self._pre = self.data["pre_shipping_orders"]
+        self._pre_dates = None   # 预备订单日期的有序列表，日期增删时置 None 按需重建
+        self._mutation_counter = 0   # 数据修改计数，mark_dirty 时递增，用于判断列表是否需要重绘
         self.reminder_after_id = None
         self.tray_icon_obj = None
         self.tray_thread = None
@@ -589,6 +1104,7 @@ class DailyReminderApp:
         self.pre_listbox = None
         self.excel_dir_var = None
         self.interval_options = []
+        self._interval_by_label = {}
         self.interval_combo = None
         self.custom_interval_entry = None
         self.reminder_chk_var = None
@@ -598,9 +1114,28 @@ class DailyReminderApp:
         self.life_expanded = True
         self.life_canvas_frame = None
         self.resize_timer = None
+        self._last_size = None
+        self._column_layout_key = None   # 上次设置表格列宽时的 (可用宽度, 表格)
+        self._last_reminder_text = None  # 提醒文本框当前内容（文本与标签交替的元组）
+        self._reminder_dirty = False     # 已排队 after_idle 刷新提醒文本
+        self._pending_refresh = set()    # 下次空闲刷新时要刷新的表格
+        self._toast = None               # 当前显示的提示 (Label, after id)
+        self._bubble_pool = {}           # 气泡提醒窗口，按类别复用
+        self._refreshing = False      # refresh_order_tables 重入保护
         self.clock_in_timer = None
         self.clock_out_timer = None
         self.custom_reminder_timers = {}  # 存储自定义提醒的定时器
+        self._scheduled_config = {}  # 已安排的自定义提醒配置：序号 -> (时间, 内容, 日期类型, 特定日期)
+        self._clock_config = {}  # 已安排的打卡提醒时间：是否上班 -> 时间字符串
+        self._reschedule_timer = None  # 合并多次编辑后重新安排自定义提醒的定时器
+        self._clock_settings_dlg = None  # 打卡设置窗口 (窗口, 回填函数)，关闭时隐藏以便再次打开时复用
+        self._dirty = False       # 内存数据是否有尚未写盘的修改
+        self._save_timer = None
+        self._save_seq = 0        # 已提交的保存快照序号
+        self._saved_seq = 0       # 已写入磁盘的最新快照序号
+        self._import_queue = queue.Queue()   # 后台导入线程 -> 主线程的消息
+        self._import_callbacks = None        # 正在进行的导入完成后的回调列表
+        self._base_title = None
         
         self.setup_ui()
 
@@ -608,6 +1143,7 @@ class DailyReminderApp:
         """设置UI"""
         self.root = tk.Tk()
         self.root.title("每日工作提醒 - 专业版")
+        _configure_ttk_styles_once()
         self.root.configure(bg=COLORS["bg_main"])
         
         window_w, window_h = 580, 720
@@ -624,21 +1160,29 @@ class DailyReminderApp:
         self.create_menu()
         
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-        self.root.bind("<Configure>", self.on_window_resize)
         # 绑定窗口大小变化事件
-        self.root.bind("<Button-1>", self.on_window_resize)
-        self.root.bind("<B1-Motion>", self.on_window_resize)
+        self.root.bind("<Configure>", self.on_window_resize)
 
     def on_window_resize(self, event):
         """Handle window resize with debouncing"""
-        if event.widget == self.root:
-            self.life_canvas.redraw()
-            # 使用防抖机制，避免频繁调整
-            if self.resize_timer:
-                self.root.after_cancel(self.resize_timer)
-            self.resize_timer = self.root.after(50, self.adjust_table_columns)
-            # 确保底部按钮区域保持固定尺寸
-            self.root.after(100, self.fix_bottom_buttons)
+        if event.widget != self.root:
+            return
+        # 窗口仅移动时尺寸不变，跳过
+        if (event.width, event.height) == self._last_size:
+            return
+        self._last_size = (event.width, event.height)
+        # 使用防抖机制，拖动结束后统一重绘
+        if self.resize_timer:
+            self.root.after_cancel(self.resize_timer)
+        self.resize_timer = self.root.after(80, self._do_resize)
+
+    def _do_resize(self):
+        """窗口尺寸稳定后执行重绘和布局调整"""
+        self.resize_timer = None
+        self.life_canvas.redraw()
+        self._do_adjust_table_columns()
+        # 确保底部按钮区域保持固定尺寸
+        self.fix_bottom_buttons()
 
     def create_life_section(self):
         """Create life progress section with expand/collapse functionality"""
@@ -722,6 +1266,12 @@ class DailyReminderApp:
             # 计算表格可用宽度（减去边距和滚动条）
             available_width = window_width - 90  # 减去左右边距和滚动条宽度
             
+            # 列宽只取决于可用宽度；与上次相同且表格未变化时无需重新设置
+            layout_key = (available_width, self.tree_shipping, self.tree_pre)
+            if layout_key == self._column_layout_key:
+                return
+            self._column_layout_key = layout_key
+            
             # 使用固定高度，确保底部按钮有足够空间
             shipping_height = 6  # 发货订单表格固定6行
             pre_height = 8       # 预备发货订单表格固定8行
@@ -816,11 +1366,6 @@ class DailyReminderApp:
         self.tree_shipping.pack(side="left", fill="both", expand=True)
         shipping_v_scrollbar.pack(side="right", fill="y")
         
-        # 绑定事件来绘制网格线
-        self.tree_shipping.bind("<Configure>", lambda e: self.draw_shipping_grid())
-        self.tree_shipping.bind("<Button-1>", lambda e: self.draw_shipping_grid())
-        self.tree_shipping.bind("<Motion>", lambda e: self.draw_shipping_grid())
-        
         
         # 预备发货订单表格区域
         pre_frame = tk.Frame(reminder_card, bg=COLORS["bg_card"], height=160)
@@ -859,11 +1404,6 @@ class DailyReminderApp:
         self.tree_pre.pack(side="left", fill="both", expand=True)
         pre_v_scrollbar.pack(side="right", fill="y")
         
-        # 绑定事件来绘制网格线
-        self.tree_pre.bind("<Configure>", lambda e: self.draw_pre_grid())
-        self.tree_pre.bind("<Button-1>", lambda e: self.draw_pre_grid())
-        self.tree_pre.bind("<Motion>", lambda e: self.draw_pre_grid())
-        
         
         self.tree_pre.bind("<Double-1>", self.on_main_pre_double_click)
 
@@ -876,289 +1416,28 @@ class DailyReminderApp:
         # ttk.Treeview 不支持直接设置 foreground 和 background
         # 颜色通过样式设置
         
-        # 立即刷新表格数据
-        self.root.after(100, lambda: self.refresh_order_tables(['main_shipping', 'main_pre']))
-        self.root.after(500, lambda: self.refresh_order_tables(['main_shipping', 'main_pre']))
-        
-        # 强制刷新表格显示
-        self.root.after(200, self.force_refresh_table_display)
-        
-        # 测试数据插入
-        self.root.after(300, self.test_table_data)
-        
-        # 初始化表格列宽和高度
-        self.root.after(100, self.adjust_table_columns)
-        
-        # 立即刷新表格数据 - 模拟控制面板的行为
-        # 确保表格创建后立即填充数据
-        self.root.after(100, self.refresh_main_tables)
-        self.root.after(300, self.refresh_main_tables)
-        self.root.after(500, self.refresh_main_tables)
-
-    def _setup_table_style(self, tree_widget):
-        """设置表格样式 - 确保文字可见并显示内部网格线"""
-        try:
-            # 创建样式对象
-            style = ttk.Style()
-            # 尝试使用不同的主题来显示网格线
-            try:
-                style.theme_use('vista')  # Vista主题通常有更好的网格线支持
-            except:
-                try:
-                    style.theme_use('winnative')  # Windows原生主题
-                except:
-                    style.theme_use('clam')  # 回退到clam主题
-            
-            # 设置简洁样式
-            style.configure("Treeview",
-                          font=("Microsoft YaHei UI", 9),
-                          background="white",
-                          foreground="#1F2937",
-                          fieldbackground="white",
-                          relief="flat",
-                          borderwidth=0,
-                          show="tree headings")
-            
-            style.configure("Treeview.Heading",
-                          font=("Microsoft YaHei UI", 9, "bold"),
-                          background="#F8FAFC",
-                          foreground="#374151",
-                          relief="flat",
-                          borderwidth=0)
-            
-            # 设置单元格样式 - 简洁设计
-            style.configure("Treeview.Cell",
-                          relief="flat",
-                          borderwidth=0,
-                          background="white",
-                          foreground="#1F2937",
-                          focuscolor="none")
-            
-            # 设置行样式 - 简洁设计
-            style.configure("Treeview.Row",
-                          relief="flat",
-                          borderwidth=0,
-                          background="white")
-            
-            # 设置列样式 - 简洁设计
-            style.configure("Treeview.Column",
-                          relief="flat",
-                          borderwidth=0)
-            
-            # 设置选中状态 - 使用更柔和的颜色
-            style.map("Treeview",
-                     background=[('selected', '#EFF6FF')],
-                     foreground=[('selected', '#1E40AF')])
-            
-            # 设置单元格映射
-            style.map("Treeview.Cell",
-                     background=[('selected', '#EFF6FF')],
-                     foreground=[('selected', '#1E40AF')])
-            
-            # 强制刷新样式
-            style.update()
-            
-            # 为表格控件设置边框和网格线
-            tree_widget.configure(relief="solid", borderwidth=1, show="headings")
-            
-            # 强制刷新表格显示
-            tree_widget.update_idletasks()
-            tree_widget.update()
-            
-            logging.info(f"Table style with internal grid applied successfully to {tree_widget}")
-            
-        except Exception as e:
-            logging.error(f"Failed to setup table style: {e}")
-            # 如果样式设置失败，至少确保表格能正常工作
-            try:
-                tree_widget.configure(relief="solid", borderwidth=1, show="headings")
-                logging.info("Applied default Treeview style with borders as fallback")
-            except Exception as e2:
-                logging.error(f"Failed to apply fallback style: {e2}")
-
-    def draw_shipping_grid(self):
-        """绘制发货订单表格的网格线"""
-        try:
-            # 获取表格尺寸
-            width = self.tree_shipping.winfo_width()
-            height = self.tree_shipping.winfo_height()
-            
-            if width <= 1 or height <= 1:
-                return
-            
-            # 获取列宽
-            try:
-                col1_width = self.tree_shipping.column("idx", "width")
-                col2_width = self.tree_shipping.column("order", "width")
-                col3_width = self.tree_shipping.column("remark", "width")
-            except:
-                # 如果获取列宽失败，使用默认值
-                col1_width = 60
-                col2_width = 200
-                col3_width = 150
-            
-            # 计算列分隔线位置
-            x1 = col1_width
-            x2 = col1_width + col2_width
-            
-            # 获取行高
-            try:
-                item_height = height // 7  # 6行数据 + 1行标题
-            except:
-                item_height = 20
-            
-            # 在表格容器上绘制网格线
-            table_container = self.tree_shipping.master
-            if hasattr(table_container, 'grid_lines'):
-                for line in table_container.grid_lines:
-                    table_container.delete(line)
-            else:
-                table_container.grid_lines = []
-            
-            # 绘制垂直线 - 使用更淡的颜色和细线
-            if x1 > 0 and x1 < width:
-                line1 = table_container.create_line(x1, 0, x1, height, fill="#E5E7EB", width=1)
-                table_container.grid_lines.append(line1)
-            if x2 > 0 and x2 < width:
-                line2 = table_container.create_line(x2, 0, x2, height, fill="#E5E7EB", width=1)
-                table_container.grid_lines.append(line2)
-            
-            # 绘制水平线 - 使用更淡的颜色和细线
-            for i in range(1, 7):  # 6行数据
-                y = i * item_height
-                if y < height:
-                    line = table_container.create_line(0, y, width, y, fill="#E5E7EB", width=1)
-                    table_container.grid_lines.append(line)
-            
-        except Exception as e:
-            logging.error(f"Failed to draw shipping grid: {e}")
-    
-    def draw_pre_grid(self):
-        """绘制预备订单表格的网格线"""
-        try:
-            # 获取表格尺寸
-            width = self.tree_pre.winfo_width()
-            height = self.tree_pre.winfo_height()
-            
-            if width <= 1 or height <= 1:
-                return
-            
-            # 获取列宽
-            try:
-                col1_width = self.tree_pre.column("date", "width")
-                col2_width = self.tree_pre.column("order", "width")
-                col3_width = self.tree_pre.column("status", "width")
-            except:
-                # 如果获取列宽失败，使用默认值
-                col1_width = 120
-                col2_width = 200
-                col3_width = 80
-            
-            # 计算列分隔线位置
-            x1 = col1_width
-            x2 = col1_width + col2_width
-            
-            # 获取行高
-            try:
-                item_height = height // 9  # 8行数据 + 1行标题
-            except:
-                item_height = 20
-            
-            # 在表格容器上绘制网格线
-            table_container = self.tree_pre.master
-            if hasattr(table_container, 'grid_lines'):
-                for line in table_container.grid_lines:
-                    table_container.delete(line)
-            else:
-                table_container.grid_lines = []
-            
-            # 绘制垂直线 - 使用更淡的颜色和细线
-            if x1 > 0 and x1 < width:
-                line1 = table_container.create_line(x1, 0, x1, height, fill="#E5E7EB", width=1)
-                table_container.grid_lines.append(line1)
-            if x2 > 0 and x2 < width:
-                line2 = table_container.create_line(x2, 0, x2, height, fill="#E5E7EB", width=1)
-                table_container.grid_lines.append(line2)
-            
-            # 绘制水平线 - 使用更淡的颜色和细线
-            for i in range(1, 9):  # 8行数据
-                y = i * item_height
-                if y < height:
-                    line = table_container.create_line(0, y, width, y, fill="#E5E7EB", width=1)
-                    table_container.grid_lines.append(line)
-            
-        except Exception as e:
-            logging.error(f"Failed to draw pre grid: {e}")
+        # 表格创建后统一执行一次初始填充
+        self.root.after(100, self._initial_table_bringup)
 
-    def force_refresh_table_display(self):
-        """强制刷新表格显示，确保文字可见"""
+    def _initial_table_bringup(self):
+        """首次填充主窗口表格并调整列宽"""
         try:
-            # 刷新主窗口表格
-            if hasattr(self, 'tree_shipping') and self.tree_shipping:
-                self.tree_shipping.update_idletasks()
-                self.tree_shipping.update()
-                logging.info("Main shipping table display refreshed")
-            
-            if hasattr(self, 'tree_pre') and self.tree_pre:
-                self.tree_pre.update_idletasks()
-                self.tree_pre.update()
-                logging.info("Main pre-shipping table display refreshed")
-            
-            # 刷新控制面板表格
-            if hasattr(self, 'control_shipping_tree') and self.control_shipping_tree:
-                self.control_shipping_tree.update_idletasks()
-                self.control_shipping_tree.update()
-                logging.info("Control shipping table display refreshed")
-            
-            if hasattr(self, 'control_pre_tree') and self.control_pre_tree:
-                self.control_pre_tree.update_idletasks()
-                self.control_pre_tree.update()
-                logging.info("Control pre-shipping table display refreshed")
-            
-            # 绘制网格线
-            self.draw_shipping_grid()
-            self.draw_pre_grid()
-            
-            # 强制刷新整个窗口
+            self.refresh_order_tables(['main_shipping', 'main_pre'])
+            self._do_adjust_table_columns()
             self.root.update_idletasks()
-            self.root.update()
-            
         except Exception as e:
-            logging.error(f"Failed to force refresh table display: {e}")
+            logging.error(f"Failed to initialize tables: {e}")
 
-    def test_table_data(self):
-        """测试表格数据插入，确保文字可见"""
+    def _setup_table_style(self, tree_widget):
+        """设置表格样式 - 全局 ttk 样式只配置一次，这里只做每个表格自身的设置"""
         try:
-            # 测试主窗口发货订单表格
-            if hasattr(self, 'tree_shipping') and self.tree_shipping:
-                # 清空现有数据
-                for item in list(self.tree_shipping.get_children("")):
-                    self.tree_shipping.delete(item)
-                
-                # 插入测试数据
-                self.tree_shipping.insert("", "end", iid="test1", values=(1, "测试订单001", "测试备注1"))
-                self.tree_shipping.insert("", "end", iid="test2", values=(2, "测试订单002", "测试备注2"))
-                self.tree_shipping.update_idletasks()
-                logging.info("Test data inserted into main shipping table")
-            
-            # 测试主窗口预备订单表格
-            if hasattr(self, 'tree_pre') and self.tree_pre:
-                # 清空现有数据
-                for item in list(self.tree_pre.get_children("")):
-                    self.tree_pre.delete(item)
-                
-                # 插入测试数据
-                self.tree_pre.insert("", "end", iid="test_pre1", values=("2025-09-21", "测试预备订单001", "未完成"))
-                self.tree_pre.insert("", "end", iid="test_pre2", values=("2025-09-22", "测试预备订单002", "完成"))
-                self.tree_pre.update_idletasks()
-                logging.info("Test data inserted into main pre-shipping table")
-            
-            # 强制刷新显示
-            self.root.update_idletasks()
-            self.root.update()
-            
+            _configure_ttk_styles_once()
+            tree_widget.configure(show="headings")
+            # 斑马纹行（由 _fill_tree 打标签）
+            tree_widget.tag_configure("evenrow", background="white")
+            tree_widget.tag_configure("oddrow", background="#F8FAFC")
         except Exception as e:
-            logging.error(f"Failed to insert test data: {e}")
+            logging.error(f"Failed to setup table style: {e}")
 
     def setup_text_tags(self):
         """Set text tags styles"""
@@ -1170,68 +1449,61 @@ class DailyReminderApp:
         self.reminder_text.tag_config("no_orders", font=FONTS["content"], foreground=COLORS["text_secondary"])
         self.reminder_text.tag_config("pre_orders", font=FONTS["content"], foreground=COLORS["warning"])
 
-    def ensure_data_loaded(self):
-        """确保数据被正确加载并显示在表格中"""
-        try:
-            # 重新加载数据
-            self.data = load_data()
-            
-            # 强制刷新界面
-            self.update_reminder_text()
-            
-            # 确保表格可见
-            if self.tree_shipping:
-                self.tree_shipping.update_idletasks()
-            if self.tree_pre:
-                self.tree_pre.update_idletasks()
-                
-        except Exception as e:
-            logging.error(f"Failed to ensure data loaded: {e}")
-
     def refresh_order_tables(self, target_tables=None):
         """统一的订单表格刷新方法
         
         Args:
             target_tables: 要刷新的表格列表，None表示刷新所有表格
                           可选值: ['main_shipping', 'main_pre', 'control_shipping', 'control_pre']
+        
+        主窗口表格显示今日发货与全部未来预备订单；控制面板表格只显示其日期框所选日期的订单。
+        刷新过程中（如 update_idletasks 内）再次调用时不会丢弃请求，而是并入待刷新集合，
+        用 after(0) 在本次刷新结束后重新排队（after_idle 会在同一次 update_idletasks 中反复执行）。
         """
+        if self._refreshing:
+            self._pending_refresh.update(self._ALL_TABLES if target_tables is None else target_tables)
+            self.root.after(0, self._mark_reminder_dirty)
+            return
+        self._refreshing = True
         try:
-            # 重新加载数据
-            self.data = load_data()
             today = today_str()
             
             # 获取发货订单数据
-            shipping_orders = self.data.get("shipping_orders", {}).get(today, [])
+            shipping_orders = self._orders_for(True, today)
             
             # 获取预备订单数据
-            pre_orders = self.data.get("pre_shipping_orders", {})
-            future_pre = []
-            for d in sorted(pre_orders.keys()):
-                if d >= today:
-                    lst = pre_orders.get(d, [])
-                    if lst:
-                        future_pre.extend([(d, item) for item in lst])
+            pre_orders = self._pre
+            # 按日期分组的未来预备订单（日期升序），两个预备表格共用
+            future_pre_grouped = {d: pre_orders[d] for d in _future_dates(pre_orders, today, self._sorted_pre_dates())}
             
             # 刷新主窗口表格
             if target_tables is None or 'main_shipping' in target_tables:
                 self._refresh_shipping_table(self.tree_shipping, shipping_orders, "main")
             
             if target_tables is None or 'main_pre' in target_tables:
-                self._refresh_pre_table(self.tree_pre, future_pre, "main")
+                self._refresh_pre_table(self.tree_pre, future_pre_grouped, "main")
             
-            # 刷新控制面板表格
+            # 刷新控制面板表格（控制面板关闭后控件已销毁，跳过）
             if target_tables is None or 'control_shipping' in target_tables:
-                if hasattr(self, 'control_shipping_tree') and self.control_shipping_tree:
-                    self._refresh_shipping_table(self.control_shipping_tree, shipping_orders, "control")
+                tree = getattr(self, 'control_shipping_tree', None)
+                if tree and tree.winfo_exists():
+                    self.refresh_order_listbox(self.so_date, tree, True)
             
             if target_tables is None or 'control_pre' in target_tables:
-                if hasattr(self, 'control_pre_tree') and self.control_pre_tree:
-                    self._refresh_pre_table(self.control_pre_tree, future_pre, "control")
+                tree = getattr(self, 'control_pre_tree', None)
+                if tree and tree.winfo_exists():
+                    self.refresh_order_listbox(self.pre_date, tree, False)
+            
+            # 所有表格填充完成后统一刷新一次显示
+            self.root.update_idletasks()
             
-            logging.info(f"Order tables refreshed: {len(shipping_orders)} shipping, {len(future_pre)} pre-orders")
+            pre_count = sum(len(orders) for orders in future_pre_grouped.values())
+            logging.info(f"Order tables refreshed: {len(shipping_orders)} shipping, {pre_count} pre-orders")
             
         except Exception as e:
             logging.error(f"Failed to refresh order tables: {e}")
+        finally:
+            self._refreshing = False
     
     def _refresh_shipping_table(self, tree_widget, shipping_orders, table_type):
         """刷新发货订单表格"""
@@ -1239,28 +1511,15 @@ class DailyReminderApp:
             return
             
         try:
-            # 清空现有数据
-            for item in list(tree_widget.get_children("")):
-                tree_widget.delete(item)
-            
-            # 填充数据
+            # 先生成全部行，再一次性替换表格内容
+            rows = []
             if shipping_orders:
+                # 条目已在加载时统一为字典（见 _normalize_orders）
                 for i, order in enumerate(shipping_orders, 1):
-                    if isinstance(order, dict):
-                        val = order.get("order", "")
-                        remark = order.get("remark", "")
-                    else:
-                        val = str(order)
-                        remark = ""
-                    tree_widget.insert("", "end", iid=f"shipping_{i}", values=(i, val, remark))
-                    logging.info(f"Inserted shipping order {i}: {val} with remark: {remark} into {table_type} table")
+                    rows.append((f"shipping_{i}", (i, order["order"], order["remark"])))
             else:
-                tree_widget.insert("", "end", iid="empty_shipping", values=("-", "今日无发货订单", ""))
-                logging.info(f"Inserted empty row into {table_type} shipping table")
-            
-            # 强制刷新显示
-            tree_widget.update_idletasks()
-            tree_widget.update()
+                rows.append(("empty_shipping", ("-", "今日无发货订单", "")))
+            _fill_tree(tree_widget, rows)
             
             # 验证数据
             children = tree_widget.get_children()
@@ -1269,188 +1528,32 @@ class DailyReminderApp:
         except Exception as e:
             logging.error(f"Failed to refresh {table_type} shipping table: {e}")
     
-    def _refresh_pre_table(self, tree_widget, future_pre, table_type):
-        """刷新预备订单表格"""
+    def _refresh_pre_table(self, tree_widget, future_pre_grouped, table_type):
+        """刷新预备订单表格，future_pre_grouped 为 {日期: 订单列表}（日期升序）"""
         if not tree_widget:
             return
             
         try:
-            # 清空现有数据
-            for item in list(tree_widget.get_children("")):
-                tree_widget.delete(item)
-            
-            # 填充数据
-            if future_pre:
-                # 按日期分组，确保每个日期的订单索引从1开始
-                date_orders = {}
-                for date, item in future_pre:
-                    if date not in date_orders:
-                        date_orders[date] = []
-                    date_orders[date].append(item)
-                
-                # 为每个日期的订单生成正确的iid
-                for date, orders in date_orders.items():
+            # 先生成全部行，再一次性替换表格内容
+            rows = []
+            if future_pre_grouped:
+                # 为每个日期的订单生成iid，日期内索引从1开始
+                for date, orders in future_pre_grouped.items():
                     for i, item in enumerate(orders, 1):
-                        if isinstance(item, dict):
-                            order_val = item.get("order", "")
-                            status = "完成" if item.get("done", False) else "未完成"
-                        else:
-                            order_val = str(item)
-                            status = "未完成"
                         # 使用日期和该日期内的索引生成唯一iid
-                        iid = f"pre_{date}_{i}"
-                        tree_widget.insert("", "end", iid=iid, values=(date, order_val, status))
-                        logging.info(f"Inserted pre-order {i}: {date} - {order_val} - {status} into {table_type} table with iid: {iid}")
+                        status = "完成" if item["done"] else "未完成"
+                        rows.append((f"pre_{date}_{i}", (date, item["order"], status)))
             else:
-                tree_widget.insert("", "end", iid="empty_pre", values=("-", "暂无预备订单", ""))
-                logging.info(f"Inserted empty row into {table_type} pre-shipping table")
-            
-            # 强制刷新显示
-            tree_widget.update_idletasks()
-            tree_widget.update()
+                rows.append(("empty_pre", ("-", "暂无预备订单", "")))
+            _fill_tree(tree_widget, rows)
             
             # 验证数据
             children = tree_widget.get_children()
-            logging.info(f"{table_type} pre-shipping table refreshed: {len(children)} rows, {len(future_pre)} orders")
+            logging.info(f"{table_type} pre-shipping table refreshed: {len(children)} rows, {len(future_pre_grouped)} dates")
             
         except Exception as e:
             logging.error(f"Failed to refresh {table_type} pre-shipping table: {e}")
 
-    def force_immediate_table_refresh(self):
-        """立即强制刷新表格显示，确保订单列表正确显示"""
-        self.refresh_order_tables(['main_shipping', 'main_pre'])
-
-    def force_show_tables(self):
-        """强制显示表格，确保表格可见"""
-        try:
-            if hasattr(self, 'tree_shipping') and self.tree_shipping:
-                # 强制刷新发货订单表格
-                self.tree_shipping.update_idletasks()
-                # 获取第一个子项并滚动到它
-                children = self.tree_shipping.get_children()
-                if children:
-                    self.tree_shipping.see(children[0])
-                logging.info("Forced shipping table to show")
-            
-            if hasattr(self, 'tree_pre') and self.tree_pre:
-                # 强制刷新预备订单表格
-                self.tree_pre.update_idletasks()
-                # 获取第一个子项并滚动到它
-                children = self.tree_pre.get_children()
-                if children:
-                    self.tree_pre.see(children[0])
-                logging.info("Forced pre-shipping table to show")
-            
-            # 强制刷新整个窗口
-            self.root.update_idletasks()
-            self.root.update()
-            
-        except Exception as e:
-            logging.error(f"Failed to force show tables: {e}")
-
-    def force_refresh_tables(self):
-        """强制刷新表格显示，确保订单列表正确显示"""
-        try:
-            # 确保表格存在
-            if not hasattr(self, 'tree_shipping') or not self.tree_shipping:
-                logging.warning("Shipping table not initialized yet")
-                return
-            if not hasattr(self, 'tree_pre') or not self.tree_pre:
-                logging.warning("Pre-shipping table not initialized yet")
-                return
-            
-            # 重新加载数据
-            self.data = load_data()
-            
-            # 更新提醒文本和表格
-            self.update_reminder_text()
-            
-            # 强制刷新表格显示
-            self.tree_shipping.update_idletasks()
-            self.tree_pre.update_idletasks()
-            
-            # 调整表格列宽
-            self.adjust_table_columns()
-            
-            logging.info("Tables force refreshed successfully")
-            
-        except Exception as e:
-            logging.error(f"Failed to force refresh tables: {e}")
-
-    def refresh_main_tables(self):
-        """刷新主窗口表格数据 - 模拟控制面板的refresh_order_listbox行为"""
-        try:
-            # 确保表格存在
-            if not hasattr(self, 'tree_shipping') or not self.tree_shipping:
-                logging.warning("Shipping table not initialized yet")
-                return
-            if not hasattr(self, 'tree_pre') or not self.tree_pre:
-                logging.warning("Pre-shipping table not initialized yet")
-                return
-            
-            # 重新加载数据
-            self.data = load_data()
-            
-            # 刷新发货订单表格
-            today = today_str()
-            shipping_orders = self.data.get("shipping_orders", {}).get(today, [])
-            
-            # 清空现有数据
-            for item in list(self.tree_shipping.get_children("")):
-                self.tree_shipping.delete(item)
-            
-            # 填充发货订单数据
-            if shipping_orders:
-                for i, order in enumerate(shipping_orders, 1):
-                    if isinstance(order, dict):
-                        val = order.get("order", "")
-                        remark = order.get("remark", "")
-                    else:
-                        val = str(order)
-                        remark = ""
-                    self.tree_shipping.insert("", "end", iid=str(i), values=(i, val, remark))
-            else:
-                self.tree_shipping.insert("", "end", iid="empty", values=("-", "今日无发货订单", ""))
-            
-            # 刷新预备订单表格
-            pre_orders = self.data.get("pre_shipping_orders", {})
-            future_pre = []
-            for d in sorted(pre_orders.keys()):
-                if d >= today:
-                    lst = pre_orders.get(d, [])
-                    if lst:
-                        future_pre.extend([(d, item) for item in lst])
-            
-            # 清空现有数据
-            for item in list(self.tree_pre.get_children("")):
-                self.tree_pre.delete(item)
-            
-            # 填充预备订单数据
-            if future_pre:
-                for i, (date, item) in enumerate(future_pre, 1):
-                    if isinstance(item, dict):
-                        order_val = item.get("order", "")
-                        status = "完成" if item.get("done", False) else "未完成"
-                    else:
-                        order_val = str(item)
-                        status = "未完成"
-                    iid = f"{date}|{i}"
-                    self.tree_pre.insert("", "end", iid=iid, values=(date, order_val, status))
-            else:
-                self.tree_pre.insert("", "end", iid="empty", values=("-", "暂无预备订单", ""))
-            
-            # 强制刷新表格显示
-            self.tree_shipping.update_idletasks()
-            self.tree_pre.update_idletasks()
-            
-            # 调整表格列宽
-            self.adjust_table_columns()
-            
-            logging.info(f"Main tables refreshed: {len(shipping_orders)} shipping orders, {len(future_pre)} pre-orders")
-            
-        except Exception as e:
-            logging.error(f"Failed to refresh main tables: {e}")
-
     def create_bottom_buttons(self):
         """Create bottom buttons with fixed position and centered layout"""
         # 创建固定位置的底部按钮区域
@@ -1490,18 +1593,78 @@ class DailyReminderApp:
         help_menu.add_command(label="ℹ️ 关于程序", command=self.show_about)
         help_menu.add_command(label="🔑 激活程序", command=activate_program)
 
-    def immediate_reminder(self):
-        """Trigger an immediate reminder"""
+    def import_orders_async(self, on_done=None):
+        """在后台线程导入 Excel 订单，完成后在主线程合并并调用 on_done(count)"""
+        if self._import_callbacks is not None:
+            # 已有导入在进行，完成后一并回调
+            if on_done:
+                self._import_callbacks.append(on_done)
+            return
+        self._import_callbacks = [on_done] if on_done else []
+        # 在主线程完成模块导入，后台线程直接使用缓存的模块
+        if EXCEL_AVAILABLE:
+            _lazy_import("openpyxl")
+        excel_dir = self.data.get("excel_dir")
+        q = self._import_queue
+
+        def worker():
+            try:
+                results = collect_orders_from_excel(
+                    excel_dir, progress=lambda done, total: q.put(("progress", done, total)))
+            except Exception as e:
+                logging.error(f"Failed to import orders from Excel: {e}")
+                results = []
+            q.put(("done", results))
+
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(100, self._drain_import_queue)
+
+    def _drain_import_queue(self):
+        """主线程轮询导入进度，导入完成后合并数据"""
+        try:
+            while True:
+                msg = self._import_queue.get_nowait()
+                if msg[0] == "progress":
+                    if self._base_title is None:
+                        self._base_title = self.root.title()
+                    self.root.title(f"{self._base_title}（正在导入Excel {msg[1]}/{msg[2]}）")
+                else:
+                    self._finish_import(msg[1])
+                    return
+        except queue.Empty:
+            pass
+        self.root.after(100, self._drain_import_queue)
+
+    def _finish_import(self, results):
+        """合并导入结果并执行回调"""
+        if self._base_title is not None:
+            self.root.title(self._base_title)
+            self._base_title = None
+        callbacks, self._import_callbacks = self._import_callbacks or [], None
+        count = 0
         try:
-            count = import_orders_from_excel(self.data)
+            count = merge_imported_orders(self.data, results, self._order_index)
             if count > 0:
-                save_data(self.data)
+                self._pre_dates = None
+                self.mark_dirty()
                 logging.info(f"Imported {count} new orders from Excel")
+        except Exception as e:
+            logging.error(f"Failed to merge imported orders: {e}")
+        for cb in callbacks:
+            try:
+                cb(count)
+            except Exception as e:
+                logging.error(f"Import callback failed: {e}")
+
+    def immediate_reminder(self):
+        """Trigger an immediate reminder"""
+        try:
+            def on_done(count):
+                self.update_reminder_text()
+                self.show_reminder()
+                logging.info("Immediate reminder triggered")
             
-            self.update_reminder_text()
-            self.show_reminder()
-            
-            logging.info("Immediate reminder triggered")
+            self.import_orders_async(on_done)
         except Exception as e:
             logging.error(f"Failed to trigger immediate reminder: {e}")
             messagebox.showerror("错误", f"立即提醒失败：{e}")
@@ -1509,177 +1672,125 @@ class DailyReminderApp:
     def update_reminder_text(self):
         """Update reminder text content"""
         try:
-            if not check_trial(self.root):
-                self.reminder_text.config(state=tk.NORMAL)
-                self.reminder_text.delete("1.0", tk.END)
-                self.reminder_text.insert(tk.END, "⚠️ 试用已结束，请激活程序以继续使用完整功能！")
-                self.reminder_text.config(state=tk.DISABLED)
+            today_date = datetime.date.today()
+            if not check_trial(self.root, today_date):
+                self._set_reminder_text(("⚠️ 试用已结束，请激活程序以继续使用完整功能！", ()))
                 return
 
             self.update_festival_reminder()
             
-            val, stage_icon, stage_text, days_text = compute_life_ui(self.data)
+            val, stage_icon, stage_text, days_text = compute_life_ui(self.data, today_date)
             self.life_canvas.set_values(val, stage_icon, stage_text, days_text)
             
-            today = today_str()
-            wd = datetime.date.today().weekday()
-            weekday_names = ["一", "二", "三", "四", "五", "六", "日"]
+            today = today_date.isoformat()
+            wd = today_date.weekday()
             
             work_msg = self.data.get("work_plan", {}).get(str(wd), "今日无特定工作安排")
-            shipping = self.data.get("shipping_orders", {}).get(today, [])
-            
-            future_pre = []
-            pre_orders = self.data.get("pre_shipping_orders", {})
-            for d in sorted(pre_orders.keys()):
-                if d >= today:
-                    lst = pre_orders.get(d, [])
-                    if lst:
-                        try:
-                            date_obj = datetime.date.fromisoformat(d)
-                            formatted_date = date_obj.strftime("%m月%d日")
-                        except ValueError:
-                            formatted_date = d
-                        # 兼容字符串与字典
-                        display_items = []
-                        for it in lst:
-                            if isinstance(it, dict):
-                                display_items.append(str(it.get("order", "")))
-                            else:
-                                display_items.append(str(it))
-                        future_pre.append(f"📦 {formatted_date}: {', '.join(display_items)}")
             
-            pre_display = "\n".join(future_pre) if future_pre else "✅ 暂无预备订单"
-
-            self.reminder_text.config(state=tk.NORMAL)
-            self.reminder_text.delete("1.0", tk.END)
+            # 发货/预备订单由 refresh_order_tables 显示在表格中，这里不再拼接订单文本
             
             # 获取节日信息
-            festival_text = self.get_festival_text()
-            date_display = f"📅 {today} 星期{weekday_names[wd]}"
+            festival_text = self.get_festival_text(today_date)
+            date_display = f"📅 {today} 星期{self._WEEKDAY_NAMES[wd]}"
             if festival_text:
                 date_display += f" | {festival_text}"
-            self.reminder_text.insert(tk.END, f"{date_display}\n", ("date_title",))
-            self.reminder_text.insert(tk.END, "="*50 + "\n", ("separator",))
-            
-            self.reminder_text.insert(tk.END, "💼 今日工作安排\n", ("section_title",))
-            self.reminder_text.insert(tk.END, f"{work_msg}\n", ("work_content",))
-            
-            self.reminder_text.config(state=tk.DISABLED)
+            self._set_reminder_text((
+                f"{date_display}\n", ("date_title",),
+                self._SEPARATOR, ("separator",),
+                self._SECTION_WORK, ("section_title",),
+                f"{work_msg}\n", ("work_content",),
+            ))
             
             # 表格刷新现在由专门的 refresh_order_tables 方法处理
             
         except Exception as e:
             logging.error(f"Failed to update reminder text: {e}")
 
-    def on_main_pre_double_click(self, event):
-        """主界面预备订单表格双击切换状态"""
+    def _show_toast(self, text, parent=None, duration_ms=1500):
+        """在窗口底部短暂显示一行提示，不阻塞事件循环；新提示直接替换旧提示"""
         try:
-            if not self.tree_pre:
-                return
-            sel = self.tree_pre.selection()
-            if not sel:
-                return
-            iid = sel[0]
-            if iid == "empty" or iid == "empty_pre":
-                return
-            
-            logging.info(f"Main pre double-clicked iid: {iid}")
-            
-            # 解析 iid 获取日期和索引信息
-            # 格式: "pre_2025-09-21_1" 或 "test_pre1" 或 "1" (旧格式)
-            if iid.startswith("pre_"):
-                try:
-                    # 从 iid 中提取日期和索引
-                    parts = iid.split("_")
-                    if len(parts) >= 3:
-                        d = parts[1]  # 日期部分
-                        idx = int(parts[2]) - 1  # 索引部分
-                        logging.info(f"Main pre parsed from iid: date={d}, idx={idx}")
-                    else:
-                        # 如果是测试数据，使用当前日期
-                        d = today_str()
-                        idx = 0
-                        logging.info(f"Main pre test data fallback: date={d}, idx={idx}")
-                except (ValueError, IndexError) as e:
-                    logging.error(f"Failed to parse main pre iid {iid}: {e}")
-                    # 如果解析失败，尝试其他方法
-                    children = list(self.tree_pre.get_children(""))
-                    idx = children.index(iid)
-                    d = self._get_date_from_table_row(self.tree_pre, iid)
-                    logging.info(f"Main pre fallback parsing: date={d}, idx={idx}")
-            elif iid.isdigit():
-                # 兼容旧格式 "1", "2", "3" 等
-                children = list(self.tree_pre.get_children(""))
-                idx = children.index(iid)
-                d = self._get_date_from_table_row(self.tree_pre, iid)
-                logging.info(f"Main pre old format iid: date={d}, idx={idx}")
-            elif "|" in iid:
-                # 格式：date|index (旧格式)
-                d, idx_str = iid.split("|", 1)
-                try:
-                    idx = int(idx_str) - 1
-                    logging.info(f"Main pre pipe format: date={d}, idx={idx}")
-                except ValueError:
-                    return
-            else:
-                # 其他格式，尝试从表格行获取信息
-                children = list(self.tree_pre.get_children(""))
-                idx = children.index(iid)
-                d = self._get_date_from_table_row(self.tree_pre, iid)
-                logging.info(f"Main pre other format iid: date={d}, idx={idx}")
-            
-            arr = self.data.setdefault("pre_shipping_orders", {}).setdefault(d, [])
-            if 0 <= idx < len(arr):
-                item = arr[idx]
-                if isinstance(item, dict):
-                    # 切换完成状态
-                    old_status = item.get("done", False)
-                    item["done"] = not old_status
-                    new_status = "完成" if item["done"] else "未完成"
-                    logging.info(f"Toggled main pre-order status: {item.get('order', '')} -> {new_status}")
-                else:
-                    # 将字符串升级为带状态的对象
-                    arr[idx] = {"order": str(item), "done": True}
-                    logging.info(f"Upgraded main pre-order to dict: {item} -> 完成")
-                
-                save_data(self.data)
-                
-                # 刷新所有相关表格
-                self.refresh_order_tables(['main_pre', 'control_pre'])
-                self.update_reminder_text()
-                
-                # 显示状态变更提示
-                order_name = item.get("order", "") if isinstance(item, dict) else str(item)
-                status_text = "完成" if (isinstance(item, dict) and item.get("done", False)) else "未完成"
-                messagebox.showinfo("状态更新", f"订单 '{order_name}' 状态已更新为: {status_text}")
-            else:
-                logging.warning(f"Index {idx} out of range for date {d}")
-                
+            self._hide_toast()
+            label = tk.Label(parent or self.root, text=text, font=FONTS["default"],
+                             bg=COLORS["text_primary"], fg="white", padx=10, pady=4)
+            label.place(relx=0.5, rely=1.0, y=-60, anchor="s")
+            self._toast = (label, self.root.after(duration_ms, self._hide_toast))
         except Exception as e:
-            logging.error(f"Failed to toggle main pre-shipping status: {e}")
-            messagebox.showerror("错误", f"切换状态失败：{e}")
+            logging.error(f"Failed to show toast: {e}")
+
+    def _hide_toast(self):
+        """移除当前提示"""
+        if self._toast is None:
+            return
+        label, after_id = self._toast
+        self._toast = None
+        try:
+            self.root.after_cancel(after_id)
+            label.destroy()
+        except tk.TclError:
+            pass
+
+    def _sorted_pre_dates(self):
+        """预备订单全部日期的有序列表（缓存），供 _future_dates 二分查找"""
+        if self._pre_dates is None:
+            self._pre_dates = sorted(self._pre)
+        return self._pre_dates
+
+    def _request_refresh(self, tables):
+        """请求在空闲时刷新指定表格和提醒文本，多次请求合并为一次刷新"""
+        self._pending_refresh.update(tables)
+        self._mark_reminder_dirty()
+
+    def _mark_reminder_dirty(self):
+        """请求在空闲时刷新提醒文本，连续多次调用只刷新一次"""
+        if not self._reminder_dirty:
+            self._reminder_dirty = True
+            self.root.after_idle(self._flush_reminder)
+
+    def _flush_reminder(self):
+        """执行排队的表格刷新和提醒文本刷新"""
+        self._reminder_dirty = False
+        tables, self._pending_refresh = self._pending_refresh, set()
+        if tables:
+            self.refresh_order_tables(sorted(tables))
+        self.update_reminder_text()
+
+    def _set_reminder_text(self, segments):
+        """替换提醒文本框内容，segments 为 (文本, 标签, 文本, 标签, ...)
 
-    def get_festival_text(self):
-        """Get festival text for display"""
+        内容未变化时直接跳过；否则一次 delete 加一次带多段标签的 insert 完成更新。
+        """
+        if segments == self._last_reminder_text:
+            return
+        self.reminder_text.config(state=tk.NORMAL)
+        self.reminder_text.delete("1.0", tk.END)
+        self.reminder_text.insert(tk.END, *segments)
+        self.reminder_text.config(state=tk.DISABLED)
+        self._last_reminder_text = segments
+
+    def on_main_pre_double_click(self, event):
+        """主界面预备订单表格双击切换状态"""
+        self.on_pre_order_double_click(event)
+
+    def get_festival_text(self, today=None):
+        """Get festival text for display, today 缺省时取当天日期"""
         try:
             festival_msgs = []
-            now = datetime.date.today()
-            
-            for k, name in self.data.get("festival_reminders", {}).items():
-                try:
-                    mm, dd = map(int, k.split('-'))
-                    fdate = datetime.date(now.year, mm, dd)
-                except ValueError:
+            now = today or datetime.date.today()
+            
+            festivals = tuple(self.data.get("festival_reminders", {}).items())
+            index = _festival_index(festivals)
+            # 只需提示今天起 4 天内的节日，按日期直接查表
+            for delta in range(4):
+                d = now + datetime.timedelta(days=delta)
+                name = index.get((d.month, d.day))
+                if not name:
                     continue
-                
-                delta = (fdate - now).days
-                if 0 <= delta <= 3:
-                    if delta == 0:
-                        festival_msgs.append(f"🎊 今天是{name}！")
-                    elif delta == 1:
-                        festival_msgs.append(f"🎈 明天是{name}")
-                    else:
-                        festival_msgs.append(f"🎁 {name}还有{delta}天")
+                if delta == 0:
+                    festival_msgs.append(f"🎊 今天是{name}！")
+                elif delta == 1:
+                    festival_msgs.append(f"🎈 明天是{name}")
+                else:
+                    festival_msgs.append(f"🎁 {name}还有{delta}天")
             
             return "  |  ".join(festival_msgs) if festival_msgs else ""
         except Exception as e:
@@ -1699,12 +1810,12 @@ class DailyReminderApp:
                 self.reminder_after_id = None
             
             if self.data.get("reminder_enabled", True) and check_trial(self.root):
-                count = import_orders_from_excel(self.data)
-                if count > 0:
-                    save_data(self.data)
-                    self.update_reminder_text()
+                def on_done(count):
+                    if count > 0:
+                        self.update_reminder_text()
+                    self.show_reminder()
                 
-                self.show_reminder()
+                self.import_orders_async(on_done)
                 
                 interval_min = int(self.data.get("reminder_interval", 120))
                 self.reminder_after_id = self.root.after(interval_min * 60 * 1000, self.schedule_reminder)
@@ -1714,53 +1825,34 @@ class DailyReminderApp:
     def show_reminder(self):
         """Show reminder popup"""
         try:
-            if not check_trial(self.root):
+            today_date = datetime.date.today()
+            if not check_trial(self.root, today_date):
                 return
             
-            today = today_str()
-            wd = datetime.date.today().weekday()
-            weekday_names = ["一", "二", "三", "四", "五", "六", "日"]
-            work_msg = self.data.get("work_plan", {}).get(str(wd), "")
-            shipping = self.data.get("shipping_orders", {}).get(today, [])
+            today = today_date.isoformat()
+            wd = today_date.weekday()
+            # 各类数据只取一次
+            data = self.data
+            work_msg = data.get("work_plan", {}).get(str(wd), "")
+            shipping = data.get("shipping_orders", {}).get(today, [])
+            pre_orders = data.get("pre_shipping_orders", {})
             
             future_pre = []
-            pre_orders = self.data.get("pre_shipping_orders", {})
-            for d in sorted(pre_orders.keys()):
-                if d >= today:
-                    lst = pre_orders.get(d, [])
-                    if lst:
-                        display_items = []
-                        for it in lst:
-                            if isinstance(it, dict):
-                                order_text = it.get("order", "")
-                                remark = it.get("remark", "")
-                                if remark:
-                                    display_items.append(f"{order_text} ({remark})")
-                                else:
-                                    display_items.append(order_text)
-                            else:
-                                display_items.append(str(it))
-                        future_pre.append(f"{d}: {', '.join(display_items)}")
+            dates = _future_dates(pre_orders, today, self._sorted_pre_dates())
+            for d in dates[:self._POPUP_MAX_PRE_DATES]:
+                display_items = [_order_label(it) for it in pre_orders[d]]
+                future_pre.append(f"{d}: {', '.join(display_items)}")
+            if len(dates) > self._POPUP_MAX_PRE_DATES:
+                future_pre.append(f"…… 另有 {len(dates) - self._POPUP_MAX_PRE_DATES} 个日期，请在主界面查看")
             pre_display = "\n".join(future_pre) if future_pre else "无"
             
-            msg = f"📅 {today} 星期{weekday_names[wd]}\n"
-            msg += f"💼 {work_msg}\n\n🚚 发货订单:\n"
+            parts = [f"📅 {today} 星期{self._WEEKDAY_NAMES[wd]}", f"💼 {work_msg}", "", "🚚 发货订单:"]
             if shipping:
-                shipping_items = []
-                for order in shipping:
-                    if isinstance(order, dict):
-                        order_text = order.get("order", "")
-                        remark = order.get("remark", "")
-                        if remark:
-                            shipping_items.append(f"• {order_text} ({remark})")
-                        else:
-                            shipping_items.append(f"• {order_text}")
-                    else:
-                        shipping_items.append(f"• {order}")
-                msg += "\n".join(shipping_items)
+                parts.extend([f"• {_order_label(order)}" for order in shipping])
             else:
-                msg += "✨ 今日无订单"
-            msg += "\n\n⌛ 预备发货:\n" + pre_display
+                parts.append("✨ 今日无订单")
+            parts += ["", "⌛ 预备发货:", pre_display]
+            msg = "\n".join(parts)
             
             self.root.after(0, lambda: messagebox.showinfo("📌 工作提醒", msg))
         except Exception as e:
@@ -1919,12 +2011,9 @@ class DailyReminderApp:
                              lambda: self.del_order(False, self.pre_date, self.control_pre_tree),
                              COLORS["error"]).pack(side="left", padx=5)
         
-        # 刷新控制面板表格
+        # 按当前所选日期（默认今天）填充一次，之后由日期选择事件和增删操作刷新
         self.refresh_order_tables(['control_shipping', 'control_pre'])
         
-        # 强制刷新表格显示
-        self.root.after(100, self.force_refresh_table_display)
-        
         if CALENDAR_AVAILABLE:
             self.so_date.bind("<<DateEntrySelected>>",
                               lambda e: self.refresh_order_tables(['control_shipping']))
@@ -1965,6 +2054,7 @@ class DailyReminderApp:
                  font=FONTS["section"]).pack(side="left")
         
         self.interval_options = [("30分钟", 30), ("1小时", 60), ("2小时", 120), ("4小时", 240)]
+        self._interval_by_label = dict(self.interval_options)   # 保存设置时按标签直接查值
         cur_interval = self.data.get("reminder_interval", 120)
         
         self.interval_combo = ttk.Combobox(interval_frame, values=[k for k, v in self.interval_options],
@@ -2078,7 +2168,7 @@ class DailyReminderApp:
                     # 重置每日递减基线
                     self.data["life_settings"]["remain_base_days"] = max(ia - ca, 0) * 365
                     self.data["life_settings"]["remain_base_date"] = datetime.date.today().isoformat()
-                    save_data(self.data)
+                    self.mark_dirty()
                     self.update_reminder_text()
                     dlg.destroy()
                     messagebox.showinfo("保存成功", "生命设置已保存！✨")
@@ -2117,14 +2207,20 @@ class DailyReminderApp:
                 return widget.get_date().strftime("%Y-%m-%d")
             else:
                 date_str = widget.get().strip()
-                datetime.date.fromisoformat(date_str)
+                if _parse_user_date(date_str) is None:
+                    messagebox.showwarning("警告", "无效的日期格式，使用今天的日期")
+                    return today_str()
                 return date_str
-        except ValueError:
-            messagebox.showwarning("警告", "无效的日期格式，使用今天的日期")
-            return today_str()
         except Exception:
             return today_str()
 
+    def _orders_for(self, is_shipping, date_str, create=False):
+        """返回某日期的订单列表；create=True 时不存在则创建，否则返回空列表"""
+        store = self._shipping if is_shipping else self._pre
+        if create:
+            return store.setdefault(date_str, [])
+        return store.get(date_str, [])
+
     def add_order(self, is_shipping, date_widget, entry_widget, listbox_widget, remark_widget=None):
         """Add order"""
         try:
@@ -2137,37 +2233,34 @@ class DailyReminderApp:
                 return
             
             key = "shipping_orders" if is_shipping else "pre_shipping_orders"
-            self.data.setdefault(key, {}).setdefault(d, [])
             
-            # 检查重复订单（考虑备注）
+            # 检查重复订单：查当天订单号集合
+            known = self._order_index.setdefault((key, d), set())
+            if o in known:
+                messagebox.showwarning("重复订单", "该订单号已存在！")
+                return
+            known.add(o)
+            if not is_shipping and d not in self._pre:
+                self._pre_dates = None
             if is_shipping:
-                # 发货订单：检查订单号是否重复
-                if any((item == o) or (isinstance(item, dict) and item.get("order") == o) for item in self.data[key][d]):
-                    messagebox.showwarning("重复订单", "该订单号已存在！")
-                    return
                 # 保存为带备注的对象
-                self.data[key][d].append({"order": o, "remark": remark})
+                self._orders_for(True, d, create=True).append({"order": o, "remark": remark})
             else:
                 # 预备订单保存为带状态的对象
-                # 向后兼容：如果已有为字符串的相同订单，视为重复
-                existing = self.data[key][d]
-                if any((item == o) or (isinstance(item, dict) and item.get("order") == o) for item in existing):
-                    messagebox.showwarning("重复订单", "该订单号已存在！")
-                    return
-                self.data[key][d].append({"order": o, "done": False, "remark": remark})
-            save_data(self.data)
-            # 刷新所有相关表格
+                self._orders_for(False, d, create=True).append({"order": o, "done": False, "remark": remark})
+            self.mark_dirty()
+            # 空闲时刷新所有相关表格和提醒文本
             if is_shipping:
-                self.refresh_order_tables(['main_shipping', 'control_shipping'])
+                self._request_refresh(['main_shipping', 'control_shipping'])
             else:
-                self.refresh_order_tables(['main_pre', 'control_pre'])
+                self._request_refresh(['main_pre', 'control_pre'])
             entry_widget.delete(0, tk.END)
             if remark_widget:
                 remark_widget.delete(0, tk.END)
-            self.update_reminder_text()
             
+            # 非阻塞提示，连续录入时不必逐个关闭消息框
             order_type = "发货订单" if is_shipping else "预备订单"
-            messagebox.showinfo("添加成功", f"{order_type}已添加！")
+            self._show_toast(f"{order_type} '{o}' 已添加", entry_widget.winfo_toplevel())
             
         except Exception as e:
             logging.error(f"Failed to add order: {e}")
@@ -2182,15 +2275,14 @@ class DailyReminderApp:
                 sel = list(listbox_widget.curselection())
             else:
                 try:
-                    sel_ids = list(listbox_widget.selection())
-                    # iids 使用插入顺序为从1开始，这里映射为索引
-                    for iid in sel_ids:
-                        try:
+                    # iid 中直接带有日期内序号（从1开始）：发货为 "1"，预备为 "pre_<日期>_1"
+                    for iid in listbox_widget.selection():
+                        if iid.isdigit():
                             sel.append(int(iid) - 1)
-                        except Exception:
-                            # Fallback: 根据当前children顺序查找
-                            children = list(listbox_widget.get_children(""))
-                            sel.append(children.index(iid))
+                        else:
+                            parsed = _parse_pre_iid(iid)
+                            if parsed is not None:
+                                sel.append(parsed[1])
                 except Exception:
                     sel = []
             if not sel:
@@ -2204,24 +2296,27 @@ class DailyReminderApp:
             sel.sort(reverse=True)
             d = self.get_date_from_widget(date_widget)
             key = "shipping_orders" if is_shipping else "pre_shipping_orders"
-            arr = self.data.get(key, {}).get(d, [])
+            arr = self._orders_for(is_shipping, d)
             
             for idx in sel:
                 if 0 <= idx < len(arr):
                     arr.pop(idx)
             if not arr:
-                self.data.get(key, {}).pop(d, None)
+                (self._shipping if is_shipping else self._pre).pop(d, None)
+                self._order_index.pop((key, d), None)
+                self._pre_dates = None
+            else:
+                self._order_index[(key, d)] = {item["order"] for item in arr}
             
-            save_data(self.data)
+            self.mark_dirty()
             
-            # 刷新所有相关表格
+            # 空闲时刷新所有相关表格和提醒文本
             if is_shipping:
-                self.refresh_order_tables(['main_shipping', 'control_shipping'])
+                self._request_refresh(['main_shipping', 'control_shipping'])
             else:
-                self.refresh_order_tables(['main_pre', 'control_pre'])
+                self._request_refresh(['main_pre', 'control_pre'])
             
-            self.update_reminder_text()
-            messagebox.showinfo("删除成功", "选中的订单已删除！")
+            self._show_toast(f"已删除 {len(sel)} 个订单", listbox_widget.winfo_toplevel())
             
         except Exception as e:
             logging.error(f"Failed to delete order: {e}")
@@ -2231,42 +2326,32 @@ class DailyReminderApp:
         """Refresh order listbox"""
         try:
             d = self.get_date_from_widget(date_widget)
+            orders = self._orders_for(is_shipping, d)
+            # 日期与数据都未变化时跳过重绘（签名记在控件上，窗口重建后自然失效）
+            sig = (is_shipping, d, len(orders), self._mutation_counter)
+            if getattr(listbox, "_render_sig", None) == sig:
+                return
+            
             # 兼容 Listbox 与 Treeview
             if isinstance(listbox, tk.Listbox):
                 listbox.delete(0, tk.END)
             
-            key = "shipping_orders" if is_shipping else "pre_shipping_orders"
-            orders = self.data.get(key, {}).get(d, [])
-            
             if isinstance(listbox, tk.Listbox):
-                for order in orders:
-                    if isinstance(order, dict):
-                        listbox.insert(tk.END, order.get("order", ""))
-                    else:
-                        listbox.insert(tk.END, order)
+                if orders:
+                    listbox.insert(tk.END, *[order["order"] for order in orders])
             else:
                 # Treeview 填充
-                for item in list(listbox.get_children("")):
-                    listbox.delete(item)
+                rows = []
                 if is_shipping:
                     for i, order in enumerate(orders, 1):
-                        if isinstance(order, dict):
-                            val = order.get("order", "")
-                            remark = order.get("remark", "")
-                        else:
-                            val = str(order)
-                            remark = ""
-                        listbox.insert("", "end", iid=str(i), values=(i, val, remark))
+                        rows.append((str(i), (i, order["order"], order["remark"])))
                 else:
                     for i, order in enumerate(orders, 1):
-                        if isinstance(order, dict):
-                            val = order.get("order", "")
-                            status = "完成" if order.get("done", False) else "未完成"
-                        else:
-                            val = str(order)
-                            status = "未完成"
-                        # 使用与_refresh_pre_table相同的iid格式
-                        listbox.insert("", "end", iid=f"pre_{d}_{i}", values=(d, val, status))
+                        status = "完成" if order["done"] else "未完成"
+                        # 使用与_refresh_pre_table相同的iid格式；首列为序号，与控制面板表头一致
+                        rows.append((f"pre_{d}_{i}", (i, order["order"], status)))
+                _fill_tree(listbox, rows)
+            listbox._render_sig = sig
         except Exception as e:
             logging.error(f"Failed to refresh order listbox: {e}")
 
@@ -2282,86 +2367,35 @@ class DailyReminderApp:
             iid = sel[0]
             logging.info(f"Double-clicked iid: {iid}")
             
-            # 解析 iid 获取日期和索引信息
-            # 格式: "pre_2025-09-21_1" 或 "test_pre1" 或 "1" (旧格式)
-            if iid.startswith("pre_"):
-                try:
-                    # 从 iid 中提取日期和索引
-                    parts = iid.split("_")
-                    if len(parts) >= 3:
-                        date_str = parts[1]  # 日期部分
-                        idx = int(parts[2]) - 1  # 索引部分
-                        logging.info(f"Parsed from iid: date={date_str}, idx={idx}")
-                    else:
-                        # 如果是测试数据，使用当前日期
-                        date_str = today_str()
-                        idx = 0
-                        logging.info(f"Test data fallback: date={date_str}, idx={idx}")
-                except (ValueError, IndexError) as e:
-                    logging.error(f"Failed to parse iid {iid}: {e}")
-                    # 如果解析失败，尝试其他方法
-                    children = list(tree.get_children(""))
-                    idx = children.index(iid)
-                    # 从表格数据中获取日期
-                    date_str = self._get_date_from_table_row(tree, iid)
-                    logging.info(f"Fallback parsing: date={date_str}, idx={idx}")
-            elif iid.isdigit():
-                # 兼容旧格式 "1", "2", "3" 等
-                children = list(tree.get_children(""))
-                idx = children.index(iid)
-                date_str = self._get_date_from_table_row(tree, iid)
-                logging.info(f"Old format iid: date={date_str}, idx={idx}")
-            else:
-                # 其他格式，尝试从表格行获取信息
-                children = list(tree.get_children(""))
-                idx = children.index(iid)
-                date_str = self._get_date_from_table_row(tree, iid)
-                logging.info(f"Other format iid: date={date_str}, idx={idx}")
+            # iid 中直接带有日期和日期内序号，占位行（如 "empty_pre"）解析结果为 None
+            parsed = _parse_pre_iid(iid)
+            if parsed is None:
+                return
+            date_str, idx = parsed
             
             # 获取对应日期的订单数据
-            arr = self.data.setdefault("pre_shipping_orders", {}).setdefault(date_str, [])
+            arr = self._orders_for(False, date_str)
             
             if 0 <= idx < len(arr):
+                # 切换完成状态
                 item = arr[idx]
-                if isinstance(item, dict):
-                    # 切换完成状态
-                    old_status = item.get("done", False)
-                    item["done"] = not old_status
-                    new_status = "完成" if item["done"] else "未完成"
-                    logging.info(f"Toggled pre-order status: {item.get('order', '')} -> {new_status}")
-                else:
-                    # 将字符串升级为带状态的对象
-                    arr[idx] = {"order": str(item), "done": True}
-                    logging.info(f"Upgraded pre-order to dict: {item} -> 完成")
+                item["done"] = not item["done"]
+                status_text = "完成" if item["done"] else "未完成"
+                logging.info(f"Toggled pre-order status: {item['order']} -> {status_text}")
                 
-                save_data(self.data)
+                self.mark_dirty()
                 
-                # 刷新所有相关表格
-                self.refresh_order_tables(['main_pre', 'control_pre'])
-                self.update_reminder_text()
+                # 空闲时刷新所有相关表格和提醒文本，连续双击只刷新一次
+                self._request_refresh(['main_pre', 'control_pre'])
                 
-                # 显示状态变更提示
-                order_name = item.get("order", "") if isinstance(item, dict) else str(item)
-                status_text = "完成" if (isinstance(item, dict) and item.get("done", False)) else "未完成"
-                messagebox.showinfo("状态更新", f"订单 '{order_name}' 状态已更新为: {status_text}")
+                # 非阻塞提示状态变更，连续双击时不会弹出一串消息框
+                self._show_toast(f"订单 '{item['order']}' 状态已更新为: {status_text}", tree.winfo_toplevel())
             else:
                 logging.warning(f"Index {idx} out of range for date {date_str}")
                 
         except Exception as e:
             logging.error(f"Failed to toggle pre-shipping status: {e}")
             messagebox.showerror("错误", f"切换状态失败：{e}")
-    
-    def _get_date_from_table_row(self, tree, iid):
-        """从表格行获取日期信息"""
-        try:
-            # 获取行的值
-            values = tree.item(iid, "values")
-            if values and len(values) >= 1:
-                return values[0]  # 第一列是日期
-            else:
-                return today_str()  # 默认返回今天
-        except Exception:
-            return today_str()
 
     def choose_excel_dir(self):
         """Choose Excel directory"""
@@ -2371,20 +2405,19 @@ class DailyReminderApp:
             if d:
                 self.excel_dir_var.set(d)
                 self.data["excel_dir"] = d
-                save_data(self.data)
+                self.mark_dirty()
         except Exception as e:
             logging.error(f"Failed to choose Excel directory: {e}")
 
     def manual_import_excel(self):
         """Manual import from Excel"""
         try:
-            count = import_orders_from_excel(self.data)
-            if count > 0:
-                save_data(self.data)
-                self.refresh_order_tables()  # 刷新所有表格
-                self.update_reminder_text()
+            def on_done(count):
+                if count > 0:
+                    self._request_refresh(self._ALL_TABLES)  # 刷新所有表格
+                messagebox.showinfo("导入完成", f"Excel数据导入完成！共导入{count}个订单")
             
-            messagebox.showinfo("导入完成", f"Excel数据导入完成！共导入{count}个订单")
+            self.import_orders_async(on_done)
         except Exception as e:
             logging.error(f"Failed to manual import Excel: {e}")
             messagebox.showerror("错误", f"导入失败：{e}")
@@ -2392,6 +2425,12 @@ class DailyReminderApp:
     def save_all_settings(self, cp_window):
         """Save all settings"""
         try:
+            # 保存前的快照，只对真正变化的设置写盘、改注册表或重排提醒
+            old_plan = dict(self.data.get("work_plan", {}))
+            old_startup = self.data.get("startup_enabled")
+            old_timing = (self.data.get("reminder_interval"), self.data.get("reminder_enabled"))
+            old_excel_dir = self.data.get("excel_dir")
+            
             for i in range(7):
                 if i in self.work_entries:
                     self.data["work_plan"][str(i)] = self.work_entries[i].get().strip()
@@ -2406,11 +2445,9 @@ class DailyReminderApp:
                             return
                         self.data["reminder_interval"] = custom_val
                     else:
-                        sel = self.interval_combo.get()
-                        for label, val in self.interval_options:
-                            if label == sel:
-                                self.data["reminder_interval"] = val
-                                break
+                        val = self._interval_by_label.get(self.interval_combo.get())
+                        if val is not None:
+                            self.data["reminder_interval"] = val
             except ValueError:
                 messagebox.showerror("错误", "请输入有效的提醒间隔（整数分钟）")
                 return
@@ -2424,15 +2461,22 @@ class DailyReminderApp:
                 if excel_dir and os.path.isdir(excel_dir):
                     self.data["excel_dir"] = excel_dir
                 else:
-                    self.data["excel_dir"] = self.data.get("excel_dir", default_data["excel_dir"])
-            
-            save_data(self.data)
-            set_startup(self.data["startup_enabled"])
-            self.update_reminder_text()
+                    self.data["excel_dir"] = self.data.get("excel_dir", DEFAULT_EXCEL_DIR)
+            
+            plan_changed = self.data["work_plan"] != old_plan
+            startup_changed = self.data.get("startup_enabled") != old_startup
+            timing_changed = (self.data.get("reminder_interval"), self.data.get("reminder_enabled")) != old_timing
+            if plan_changed or startup_changed or timing_changed or self.data.get("excel_dir") != old_excel_dir:
+                self.mark_dirty()
+            if startup_changed:
+                set_startup(self.data["startup_enabled"])
+            if plan_changed:
+                self.update_reminder_text()
             
             messagebox.showinfo("保存成功", "所有设置已保存！✨")
             cp_window.destroy()
-            self.schedule_reminder()
+            if timing_changed:
+                self.schedule_reminder()
             
         except Exception as e:
             logging.error(f"Failed to save settings: {e}")
@@ -2445,17 +2489,7 @@ class DailyReminderApp:
             if act_data.get("activated", False):
                 status = "✅ 已激活"
             else:
-                start = act_data.get("trial_start")
-                if start:
-                    try:
-                        start_date = datetime.date.fromisoformat(start)
-                        days_used = (datetime.date.today() - start_date).days
-                        days_left = max(TRIAL_DAYS - days_used, 0)
-                        status = f"⏳ 试用中，剩余 {days_left} 天"
-                    except ValueError:
-                        status = f"⏳ 试用中，剩余 {TRIAL_DAYS} 天"
-                else:
-                    status = f"⏳ 试用中，剩余 {TRIAL_DAYS} 天"
+                status = f"⏳ 试用中，剩余 {_trial_days_left(act_data)} 天"
             
             deps_status = []
             install_commands = []
@@ -2485,116 +2519,86 @@ class DailyReminderApp:
         except Exception as e:
             logging.error(f"Failed to show about info: {e}")
 
+    def _build_bubble(self, kind):
+        """创建一类气泡提醒窗口（右下角、无标题栏、置顶），返回其控件"""
+        style = self._BUBBLE_STYLES[kind]
+        bg = COLORS[style["color"]]
+        bubble = tk.Toplevel(self.root)
+        bubble.title(style["window_title"])
+        bubble.overrideredirect(True)  # 移除标题栏
+        bubble.attributes('-topmost', True)  # 置顶显示
+        bubble.configure(bg=bg)
+        
+        # 设置窗口大小和位置（右下角）
+        bubble_width, bubble_height = style["size"]
+        x = bubble.winfo_screenwidth() - bubble_width - 20
+        y = bubble.winfo_screenheight() - bubble_height - 80  # 避免任务栏遮挡
+        bubble.geometry(f"{bubble_width}x{bubble_height}+{x}+{y}")
+        
+        # 创建内容框架
+        content_frame = tk.Frame(bubble, bg=bg)
+        content_frame.pack(fill="both", expand=True, padx=style["pad"], pady=style["pad"])
+        
+        # 标题与消息内容，文字在每次显示时设置
+        title_label = tk.Label(content_frame, font=FONTS["section"], fg="white", bg=bg)
+        title_label.pack(anchor="w", pady=(0, style["title_gap"]))
+        message_label = tk.Label(content_frame, font=FONTS["default"], fg="white", bg=bg,
+                                 wraplength=style["wraplength"], justify="left")
+        message_label.pack(anchor="w")
+        
+        # 点击任意位置或关闭按钮隐藏
+        close_btn = tk.Label(bubble, text="×", font=FONTS["subtitle"],
+                             fg="white", bg=bg, cursor="hand2")
+        close_btn.place(relx=0.95, rely=0.1, anchor="ne")
+        for widget in (bubble, title_label, message_label, close_btn):
+            widget.bind("<Button-1>", lambda e: self._hide_bubble(kind))
+        
+        return {"window": bubble, "title_label": title_label,
+                "message_label": message_label, "timer": None}
+
+    def _make_bubble(self, kind, title, message):
+        """显示气泡提醒；每类气泡只创建一次窗口，之后只更新文字并重新显示"""
+        bubble = self._bubble_pool.get(kind)
+        if bubble is None or not bubble["window"].winfo_exists():
+            bubble = self._bubble_pool[kind] = self._build_bubble(kind)
+        elif bubble["timer"] is not None:
+            bubble["window"].after_cancel(bubble["timer"])
+        
+        bubble["title_label"].configure(text=title)
+        bubble["message_label"].configure(text=message)
+        window = bubble["window"]
+        window.deiconify()
+        window.lift()
+        # 自动关闭定时器
+        bubble["timer"] = window.after(self._BUBBLE_STYLES[kind]["timeout_ms"],
+                                       lambda: self._hide_bubble(kind))
+
+    def _hide_bubble(self, kind):
+        """隐藏气泡（保留窗口供下次复用）"""
+        bubble = self._bubble_pool.get(kind)
+        if bubble is None:
+            return
+        try:
+            if bubble["timer"] is not None:
+                bubble["window"].after_cancel(bubble["timer"])
+                bubble["timer"] = None
+            bubble["window"].withdraw()
+        except tk.TclError:
+            self._bubble_pool.pop(kind, None)
+
     def show_clock_notification(self, title, message, is_clock_in=True):
         """显示上下班打卡提醒气泡"""
         try:
-            # 创建气泡窗口
-            bubble = tk.Toplevel(self.root)
-            bubble.title("打卡提醒")
-            bubble.overrideredirect(True)  # 移除标题栏
-            bubble.attributes('-topmost', True)  # 置顶显示
-            bubble.configure(bg=COLORS["primary"])
-            
-            # 设置窗口大小和位置（右下角）
-            bubble_width = 300
-            bubble_height = 100
-            screen_width = bubble.winfo_screenwidth()
-            screen_height = bubble.winfo_screenheight()
-            x = screen_width - bubble_width - 20
-            y = screen_height - bubble_height - 80  # 避免任务栏遮挡
-            
-            bubble.geometry(f"{bubble_width}x{bubble_height}+{x}+{y}")
-            
-            # 创建内容框架
-            content_frame = tk.Frame(bubble, bg=COLORS["primary"])
-            content_frame.pack(fill="both", expand=True, padx=10, pady=10)
-            
-            # 图标和标题
             icon_text = "🌅" if is_clock_in else "🌆"
-            title_label = tk.Label(content_frame, text=f"{icon_text} {title}",
-                                 font=FONTS["section"], fg="white", bg=COLORS["primary"])
-            title_label.pack(anchor="w", pady=(0, 5))
-            
-            # 消息内容
-            message_label = tk.Label(content_frame, text=message,
-                                   font=FONTS["default"], fg="white", bg=COLORS["primary"],
-                                   wraplength=280, justify="left")
-            message_label.pack(anchor="w")
-            
-            # 自动关闭定时器
-            bubble.after(5000, bubble.destroy)  # 5秒后自动关闭
-            
-            # 点击关闭
-            def close_bubble(event):
-                bubble.destroy()
-            
-            bubble.bind("<Button-1>", close_bubble)
-            title_label.bind("<Button-1>", close_bubble)
-            message_label.bind("<Button-1>", close_bubble)
-            
-            # 添加关闭按钮
-            close_btn = tk.Label(bubble, text="×", font=FONTS["subtitle"],
-                               fg="white", bg=COLORS["primary"], cursor="hand2")
-            close_btn.place(relx=0.95, rely=0.1, anchor="ne")
-            close_btn.bind("<Button-1>", close_bubble)
-            
+            self._make_bubble("clock", f"{icon_text} {title}", message)
         except Exception as e:
             logging.error(f"Failed to show clock notification: {e}")
 
     def show_custom_reminder_notification(self, title, message):
         """显示自定义提醒气泡"""
         try:
-            # 创建气泡窗口
-            bubble = tk.Toplevel(self.root)
-            bubble.title("自定义提醒")
-            bubble.overrideredirect(True)  # 移除标题栏
-            bubble.attributes('-topmost', True)  # 置顶显示
-            bubble.configure(bg=COLORS["accent"])
-            
-            # 设置窗口大小和位置（右下角）
-            bubble_width = 320
-            bubble_height = 120
-            screen_width = bubble.winfo_screenwidth()
-            screen_height = bubble.winfo_screenheight()
-            x = screen_width - bubble_width - 20
-            y = screen_height - bubble_height - 80  # 避免任务栏遮挡
-            
-            bubble.geometry(f"{bubble_width}x{bubble_height}+{x}+{y}")
-            
-            # 创建内容框架
-            content_frame = tk.Frame(bubble, bg=COLORS["accent"])
-            content_frame.pack(fill="both", expand=True, padx=12, pady=12)
-            
-            # 图标和标题
-            title_label = tk.Label(content_frame, text=f"🔔 {title}",
-                                 font=FONTS["section"], fg="white", bg=COLORS["accent"])
-            title_label.pack(anchor="w", pady=(0, 8))
-            
-            # 消息内容
-            message_label = tk.Label(content_frame, text=message,
-                                   font=FONTS["default"], fg="white", bg=COLORS["accent"],
-                                   wraplength=290, justify="left")
-            message_label.pack(anchor="w")
-            
-            # 自动关闭定时器
-            bubble.after(6000, bubble.destroy)  # 6秒后自动关闭
-            
-            # 点击关闭
-            def close_bubble(event):
-                bubble.destroy()
-            
-            bubble.bind("<Button-1>", close_bubble)
-            title_label.bind("<Button-1>", close_bubble)
-            message_label.bind("<Button-1>", close_bubble)
-            
-            # 添加关闭按钮
-            close_btn = tk.Label(bubble, text="×", font=FONTS["subtitle"],
-                               fg="white", bg=COLORS["accent"], cursor="hand2")
-            close_btn.place(relx=0.95, rely=0.1, anchor="ne")
-            close_btn.bind("<Button-1>", close_bubble)
-            
+            self._make_bubble("custom", f"🔔 {title}", message)
             logging.info(f"Custom reminder notification shown: {title} - {message}")
-            
         except Exception as e:
             logging.error(f"Failed to show custom reminder notification: {e}")
 
@@ -2608,59 +2612,75 @@ class DailyReminderApp:
             messagebox.showerror("测试失败", f"测试提醒失败：{e}")
 
     def schedule_clock_reminders(self):
-        """安排上下班打卡提醒"""
+        """安排上下班打卡提醒，只重新安排时间或开关有变化的一项"""
         try:
-            # 取消现有的定时器
-            if self.clock_in_timer:
-                self.root.after_cancel(self.clock_in_timer)
-                self.clock_in_timer = None
-            if self.clock_out_timer:
-                self.root.after_cancel(self.clock_out_timer)
-                self.clock_out_timer = None
-            
             clock_settings = self.data.get("clock_settings", {})
-            
+            desired = {}
             # 上班提醒
             if clock_settings.get("clock_in_enabled", False):
-                clock_in_time = clock_settings.get("clock_in_time", "09:00")
-                self.schedule_clock_reminder(clock_in_time, True)
-            
+                desired[True] = clock_settings.get("clock_in_time", "09:00")
             # 下班提醒
             if clock_settings.get("clock_out_enabled", False):
-                clock_out_time = clock_settings.get("clock_out_time", "18:00")
-                self.schedule_clock_reminder(clock_out_time, False)
+                desired[False] = clock_settings.get("clock_out_time", "18:00")
+            
+            now = None
+            for is_clock_in in (True, False):
+                time_str = desired.get(is_clock_in)
+                if self._clock_config.get(is_clock_in) == time_str:
+                    continue
+                # 配置有变化：取消该项现有的定时器
+                attr = "clock_in_timer" if is_clock_in else "clock_out_timer"
+                timer_id = getattr(self, attr)
+                if timer_id:
+                    self.root.after_cancel(timer_id)
+                    setattr(self, attr, None)
+                self._clock_config.pop(is_clock_in, None)
+                if time_str:
+                    now = now or datetime.datetime.now()
+                    self.schedule_clock_reminder(time_str, is_clock_in, now)
+                    self._clock_config[is_clock_in] = time_str
                 
         except Exception as e:
             logging.error(f"Failed to schedule clock reminders: {e}")
 
     def schedule_custom_reminders(self):
-        """安排自定义提醒"""
+        """安排自定义提醒，只重新安排配置有变化的提醒"""
         try:
-            # 取消现有的自定义提醒定时器
-            for timer_id in self.custom_reminder_timers.values():
-                if timer_id:
-                    self.root.after_cancel(timer_id)
-            self.custom_reminder_timers.clear()
-            
-            # 获取自定义提醒配置
+            # 获取自定义提醒配置，计算每条启用提醒的期望配置
             custom_reminders = self.data.get("custom_reminders", [])
-            
+            desired = {}
             for i, reminder in enumerate(custom_reminders):
-                if reminder.get("enabled", True):
-                    time_str = reminder.get("time", "")
-                    content = reminder.get("content", "")
-                    
-                    if time_str and content:
-                        timer_id = self.schedule_custom_reminder(time_str, content, i)
-                        self.custom_reminder_timers[i] = timer_id
+                time_str, content, enabled, date_type, specific_date = _reminder_fields(reminder)
+                if enabled and time_str and content:
+                    desired[i] = (time_str, content, date_type, specific_date)
+            
+            # 取消已删除、已停用或配置有变化的提醒
+            for i in list(self._scheduled_config):
+                if desired.get(i) != self._scheduled_config[i]:
+                    timer_id = self.custom_reminder_timers.pop(i, None)
+                    if timer_id:
+                        self.root.after_cancel(timer_id)
+                    del self._scheduled_config[i]
+            
+            # 只安排新增或有变化的提醒
+            now = None
+            changed = 0
+            for i, config in desired.items():
+                if i in self._scheduled_config:
+                    continue
+                now = now or datetime.datetime.now()
+                timer_id = self.schedule_custom_reminder(config[0], config[1], i, now)
+                self.custom_reminder_timers[i] = timer_id
+                self._scheduled_config[i] = config
+                changed += 1
                         
-            logging.info(f"Scheduled {len(self.custom_reminder_timers)} custom reminders")
+            logging.info(f"Scheduled {changed} changed custom reminders ({len(desired)} active)")
             
         except Exception as e:
             logging.error(f"Failed to schedule custom reminders: {e}")
 
-    def schedule_custom_reminder(self, time_str, content, reminder_index):
-        """安排单个自定义提醒"""
+    def schedule_custom_reminder(self, time_str, content, reminder_index, now=None):
+        """安排单个自定义提醒，批量安排时由调用方传入同一个 now"""
         try:
             # 获取提醒配置
             custom_reminders = self.data.get("custom_reminders", [])
@@ -2671,24 +2691,22 @@ class DailyReminderApp:
             date_type = reminder.get("date_type", "daily")
             specific_date = reminder.get("specific_date", "")
             
-            # 解析时间
-            hour, minute = map(int, time_str.split(':'))
-            now = datetime.datetime.now()
+            # 解析时间（按字符串缓存）
+            hour, minute = _parse_hhmm(time_str)
+            now = now or datetime.datetime.now()
             
             if date_type == "specific" and specific_date:
                 # 特定日期提醒
-                try:
-                    target_date = datetime.date.fromisoformat(specific_date)
-                    target_time = datetime.datetime.combine(target_date, datetime.time(hour, minute))
-                    
-                    # 如果特定日期已过，不安排提醒
-                    if target_time <= now:
-                        logging.info(f"Specific date reminder '{content}' for {specific_date} has passed, skipping")
-                        return None
-                        
-                except ValueError:
+                target_date = _parse_iso_date(specific_date)
+                if target_date is None:
                     logging.error(f"Invalid specific date format: {specific_date}")
                     return None
+                target_time = datetime.datetime.combine(target_date, datetime.time(hour, minute))
+                
+                # 如果特定日期已过，不安排提醒
+                if target_time <= now:
+                    logging.info(f"Specific date reminder '{content}' for {specific_date} has passed, skipping")
+                    return None
             else:
                 # 每日重复提醒
                 target_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
@@ -2698,7 +2716,7 @@ class DailyReminderApp:
                     target_time += datetime.timedelta(days=1)
             
             # 计算延迟时间（毫秒）
-            delay_ms = int((target_time - now).total_seconds() * 1000)
+            delay_ms = _delay_ms_until(target_time, now)
             
             # 安排提醒
             timer_id = self.root.after(delay_ms, 
@@ -2738,12 +2756,12 @@ class DailyReminderApp:
         except Exception as e:
             logging.error(f"Failed to trigger custom reminder: {e}")
 
-    def schedule_clock_reminder(self, time_str, is_clock_in):
+    def schedule_clock_reminder(self, time_str, is_clock_in, now=None):
         """安排单个打卡提醒"""
         try:
-            # 解析时间
-            hour, minute = map(int, time_str.split(':'))
-            now = datetime.datetime.now()
+            # 解析时间（按字符串缓存）
+            hour, minute = _parse_hhmm(time_str)
+            now = now or datetime.datetime.now()
             target_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
             
             # 如果今天的时间已过，安排明天
@@ -2751,7 +2769,7 @@ class DailyReminderApp:
                 target_time += datetime.timedelta(days=1)
             
             # 计算延迟时间（毫秒）
-            delay_ms = int((target_time - now).total_seconds() * 1000)
+            delay_ms = _delay_ms_until(target_time, now)
             
             # 安排提醒
             if is_clock_in:
@@ -2794,6 +2812,11 @@ class DailyReminderApp:
 
     def open_custom_reminder_settings(self):
         """打开自定义提醒设置窗口"""
+        # 本窗口控件较多，常用颜色与字体先取到局部变量
+        bg_card = COLORS["bg_card"]
+        text_secondary = COLORS["text_secondary"]
+        font_content = FONTS["content"]
+        font_default = FONTS["default"]
         try:
             dlg = tk.Toplevel(self.root)
             dlg.title("🔔 自定义提醒设置")
@@ -2807,14 +2830,14 @@ class DailyReminderApp:
             content_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
             # 左侧：提醒列表
-            left_frame = tk.Frame(content_frame, bg=COLORS["bg_card"])
+            left_frame = tk.Frame(content_frame, bg=bg_card)
             left_frame.pack(side="left", fill="both", expand=True, padx=(0, 10))
             
-            tk.Label(left_frame, text="📋 提醒事项列表", font=FONTS["content"], 
-                    bg=COLORS["bg_card"], fg=COLORS["text_primary"]).pack(pady=10)
+            tk.Label(left_frame, text="📋 提醒事项列表", font=font_content, 
+                    bg=bg_card, fg=COLORS["text_primary"]).pack(pady=10)
             
             # 创建提醒列表
-            list_frame = tk.Frame(left_frame, bg=COLORS["bg_card"])
+            list_frame = tk.Frame(left_frame, bg=bg_card)
             list_frame.pack(fill="both", expand=True, padx=10, pady=(0, 10))
             
             # 表格显示提醒事项
@@ -2836,199 +2859,202 @@ class DailyReminderApp:
             scrollbar.pack(side="right", fill="y")
             
             # 右侧：编辑表单
-            right_frame = tk.Frame(content_frame, bg=COLORS["bg_card"])
+            right_frame = tk.Frame(content_frame, bg=bg_card)
             right_frame.pack(side="right", fill="y", padx=(10, 0))
             right_frame.configure(width=400)
             
             
             # 编辑表单
-            form_frame = tk.Frame(right_frame, bg=COLORS["bg_card"])
+            form_frame = tk.Frame(right_frame, bg=bg_card)
             form_frame.pack(fill="x", padx=10, pady=(0, 10))
             
             # 提醒时间输入 - 时间轴形式
-            tk.Label(form_frame, text="提醒时间:", font=FONTS["content"], 
-                    bg=COLORS["bg_card"]).pack(anchor="w", pady=(0, 5))
+            tk.Label(form_frame, text="提醒时间:", font=font_content, 
+                    bg=bg_card).pack(anchor="w", pady=(0, 5))
             
             # 时间轴容器
-            time_frame = tk.Frame(form_frame, bg=COLORS["bg_card"])
+            time_frame = tk.Frame(form_frame, bg=bg_card)
             time_frame.pack(fill="x", pady=(0, 10))
             
             # 小时选择
-            hour_frame = tk.Frame(time_frame, bg=COLORS["bg_card"])
+            hour_frame = tk.Frame(time_frame, bg=bg_card)
             hour_frame.pack(side="left", fill="x", expand=True, padx=(0, 5))
             
-            tk.Label(hour_frame, text="时", font=FONTS["default"], 
-                    bg=COLORS["bg_card"], fg=COLORS["text_secondary"]).pack(anchor="w")
+            tk.Label(hour_frame, text="时", font=font_default, 
+                    bg=bg_card, fg=text_secondary).pack(anchor="w")
             
             hour_var = tk.IntVar(value=9)
-            hour_scale = tk.Scale(hour_frame, from_=0, to=23, orient="horizontal", 
-                                variable=hour_var, bg=COLORS["bg_card"], 
-                                font=FONTS["default"], length=150, 
-                                showvalue=True, tickinterval=4)
-            hour_scale.pack(fill="x", pady=(2, 0))
+            hour_spin = tk.Spinbox(hour_frame, from_=0, to=23, textvariable=hour_var,
+                                   width=4, font=font_default, wrap=True)
+            hour_spin.pack(anchor="w", pady=(2, 0))
             
             # 分钟选择
-            minute_frame = tk.Frame(time_frame, bg=COLORS["bg_card"])
+            minute_frame = tk.Frame(time_frame, bg=bg_card)
             minute_frame.pack(side="right", fill="x", expand=True, padx=(5, 0))
             
-            tk.Label(minute_frame, text="分", font=FONTS["default"], 
-                    bg=COLORS["bg_card"], fg=COLORS["text_secondary"]).pack(anchor="w")
+            tk.Label(minute_frame, text="分", font=font_default, 
+                    bg=bg_card, fg=text_secondary).pack(anchor="w")
             
             minute_var = tk.IntVar(value=0)
-            minute_scale = tk.Scale(minute_frame, from_=0, to=59, orient="horizontal", 
-                                  variable=minute_var, bg=COLORS["bg_card"], 
-                                  font=FONTS["default"], length=150, 
-                                  showvalue=True, tickinterval=15)
-            minute_scale.pack(fill="x", pady=(2, 0))
+            minute_spin = tk.Spinbox(minute_frame, from_=0, to=59, textvariable=minute_var,
+                                     width=4, font=font_default, wrap=True)
+            minute_spin.pack(anchor="w", pady=(2, 0))
             
             # 时间显示标签
-            time_display_frame = tk.Frame(form_frame, bg=COLORS["bg_card"])
+            time_display_frame = tk.Frame(form_frame, bg=bg_card)
             time_display_frame.pack(fill="x", pady=(5, 0))
             
             time_display_label = tk.Label(time_display_frame, text="09:00", 
-                                        font=FONTS["section"], bg=COLORS["bg_card"], 
+                                        font=FONTS["section"], bg=bg_card, 
                                         fg=COLORS["primary"])
             time_display_label.pack()
             
-            # 更新时间显示
+            # 更新时间显示：时、分变量的多次修改合并到空闲时处理一次，文本不变时不重绘标签
+            display_pending = [False]
+            time_display_label._last_text = "09:00"
+            
+            def flush_time_display():
+                display_pending[0] = False
+                try:
+                    time_str = f"{hour_var.get():02d}:{minute_var.get():02d}"
+                    if time_str != time_display_label._last_text:
+                        time_display_label.config(text=time_str)
+                        time_display_label._last_text = time_str
+                except tk.TclError:
+                    pass
+            
             def update_time_display(*args):
-                hour = hour_var.get()
-                minute = minute_var.get()
-                time_str = f"{hour:02d}:{minute:02d}"
-                time_display_label.config(text=time_str)
+                if not display_pending[0]:
+                    display_pending[0] = True
+                    dlg.after_idle(flush_time_display)
             
             hour_var.trace("w", update_time_display)
             minute_var.trace("w", update_time_display)
             
             # 快捷时间按钮
-            quick_time_frame = tk.Frame(form_frame, bg=COLORS["bg_card"])
+            quick_time_frame = tk.Frame(form_frame, bg=bg_card)
             quick_time_frame.pack(fill="x", pady=(10, 0))
             
-            tk.Label(quick_time_frame, text="快捷时间:", font=FONTS["default"], 
-                    bg=COLORS["bg_card"], fg=COLORS["text_secondary"]).pack(anchor="w", pady=(0, 5))
+            tk.Label(quick_time_frame, text="快捷时间:", font=font_default, 
+                    bg=bg_card, fg=text_secondary).pack(anchor="w", pady=(0, 5))
             
-            quick_buttons_frame = tk.Frame(quick_time_frame, bg=COLORS["bg_card"])
+            quick_buttons_frame = tk.Frame(quick_time_frame, bg=bg_card)
             quick_buttons_frame.pack(fill="x")
             
             # 定义快捷时间
-            quick_times = [
-                ("09:00", "上班"), ("12:00", "午休"), ("13:00", "下午"), 
-                ("18:00", "下班"), ("20:00", "晚上"), ("22:00", "睡前")
-            ]
+            quick_times = (
+                (9, 0, "上班"), (12, 0, "午休"), (13, 0, "下午"),
+                (18, 0, "下班"), (20, 0, "晚上"), (22, 0, "睡前")
+            )
             
             def set_quick_time(hour, minute):
                 hour_var.set(hour)
                 minute_var.set(minute)
             
-            for i, (time_str, label) in enumerate(quick_times):
-                hour, minute = map(int, time_str.split(':'))
+            for hour, minute, label in quick_times:
                 btn = create_modern_button(quick_buttons_frame, label, 
                                          lambda h=hour, m=minute: set_quick_time(h, m),
                                          button_type="primary")
                 btn.pack(side="left", padx=(0, 8), pady=2)
             
             # 日期选择
-            date_frame = tk.Frame(form_frame, bg=COLORS["bg_card"])
+            date_frame = tk.Frame(form_frame, bg=bg_card)
             date_frame.pack(fill="x", pady=(0, 10))
             
-            tk.Label(date_frame, text="提醒日期:", font=FONTS["content"], 
-                    bg=COLORS["bg_card"]).pack(anchor="w", pady=(0, 5))
+            tk.Label(date_frame, text="提醒日期:", font=font_content, 
+                    bg=bg_card).pack(anchor="w", pady=(0, 5))
             
             # 日期类型选择
-            date_type_frame = tk.Frame(date_frame, bg=COLORS["bg_card"])
+            date_type_frame = tk.Frame(date_frame, bg=bg_card)
             date_type_frame.pack(fill="x", pady=(0, 5))
             
             date_type_var = tk.StringVar(value="daily")
             
             daily_radio = tk.Radiobutton(date_type_frame, text="每日重复", 
                                        variable=date_type_var, value="daily",
-                                       bg=COLORS["bg_card"], font=FONTS["default"],
-                                       command=lambda: self.toggle_date_input(date_type_var, specific_date_frame))
+                                       bg=bg_card, font=font_default,
+                                       command=lambda: self.toggle_date_input(date_type_var, get_specific_date))
             daily_radio.pack(side="left", padx=(0, 20))
             
             specific_radio = tk.Radiobutton(date_type_frame, text="特定日期", 
                                           variable=date_type_var, value="specific",
-                                          bg=COLORS["bg_card"], font=FONTS["default"],
-                                          command=lambda: self.toggle_date_input(date_type_var, specific_date_frame))
+                                          bg=bg_card, font=font_default,
+                                          command=lambda: self.toggle_date_input(date_type_var, get_specific_date))
             specific_radio.pack(side="left")
             
-            # 特定日期输入框架
-            specific_date_frame = tk.Frame(date_frame, bg=COLORS["bg_card"])
-            specific_date_frame.pack(fill="x", pady=(5, 0))
+            # 特定日期输入：多数提醒为每日重复，首次需要时才创建日期控件和快捷按钮
+            specific_date_parts = []
             
-            # 特定日期输入
-            if CALENDAR_AVAILABLE:
-                specific_date_widget = DateEntry(specific_date_frame, width=16, date_pattern="yyyy-mm-dd",
-                                               font=FONTS["content"])
-            else:
-                specific_date_widget = tk.Entry(specific_date_frame, width=18, font=FONTS["content"])
-                specific_date_widget.insert(0, datetime.date.today().strftime("%Y-%m-%d"))
-            specific_date_widget.pack(side="left", padx=(0, 10))
-            
-            # 快捷日期按钮
-            quick_date_frame = tk.Frame(specific_date_frame, bg=COLORS["bg_card"])
-            quick_date_frame.pack(side="left")
-            
-            def set_today():
-                today = datetime.date.today()
-                if CALENDAR_AVAILABLE:
-                    specific_date_widget.set_date(today)
-                else:
-                    specific_date_widget.delete(0, tk.END)
-                    specific_date_widget.insert(0, today.strftime("%Y-%m-%d"))
-            
-            def set_tomorrow():
-                tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+            def get_specific_date(create=True):
+                """返回 (特定日期框架, 日期控件)；尚未创建且 create=False 时返回 None"""
+                if specific_date_parts:
+                    return specific_date_parts
+                if not create:
+                    return None
+                specific_date_frame = tk.Frame(date_frame, bg=bg_card)
+                
+                # 特定日期输入
                 if CALENDAR_AVAILABLE:
-                    specific_date_widget.set_date(tomorrow)
+                    specific_date_widget = DateEntry(specific_date_frame, width=16, date_pattern="yyyy-mm-dd",
+                                                   font=font_content)
                 else:
-                    specific_date_widget.delete(0, tk.END)
-                    specific_date_widget.insert(0, tomorrow.strftime("%Y-%m-%d"))
-            
-            today_btn = create_modern_button(quick_date_frame, "今天", set_today,
-                                           button_type="success")
-            today_btn.pack(side="left", padx=(0, 8))
-            
-            tomorrow_btn = create_modern_button(quick_date_frame, "明天", set_tomorrow,
-                                              button_type="warning")
-            tomorrow_btn.pack(side="left")
+                    specific_date_widget = tk.Entry(specific_date_frame, width=18, font=font_content)
+                    specific_date_widget.insert(0, datetime.date.today().strftime("%Y-%m-%d"))
+                specific_date_widget.pack(side="left", padx=(0, 10))
+                
+                # 快捷日期按钮
+                quick_date_frame = tk.Frame(specific_date_frame, bg=bg_card)
+                quick_date_frame.pack(side="left")
+                
+                def set_date(day):
+                    if CALENDAR_AVAILABLE:
+                        specific_date_widget.set_date(day)
+                    else:
+                        specific_date_widget.delete(0, tk.END)
+                        specific_date_widget.insert(0, day.strftime("%Y-%m-%d"))
+                
+                today_btn = create_modern_button(quick_date_frame, "今天",
+                                               lambda: set_date(datetime.date.today()),
+                                               button_type="success")
+                today_btn.pack(side="left", padx=(0, 8))
+                
+                tomorrow_btn = create_modern_button(quick_date_frame, "明天",
+                                                  lambda: set_date(datetime.date.today() + datetime.timedelta(days=1)),
+                                                  button_type="warning")
+                tomorrow_btn.pack(side="left")
+                
+                specific_date_parts[:] = [specific_date_frame, specific_date_widget]
+                return specific_date_parts
             
-            # 初始隐藏特定日期输入
-            specific_date_frame.pack_forget()
+            def hide_specific_date():
+                parts = get_specific_date(create=False)
+                if parts:
+                    parts[0].pack_forget()
             
             # 提醒内容输入
-            tk.Label(form_frame, text="提醒内容:", font=FONTS["content"], 
-                    bg=COLORS["bg_card"]).pack(anchor="w", pady=(0, 5))
+            tk.Label(form_frame, text="提醒内容:", font=font_content, 
+                    bg=bg_card).pack(anchor="w", pady=(0, 5))
             content_var = tk.StringVar()
-            content_entry = tk.Entry(form_frame, textvariable=content_var, font=FONTS["content"])
+            content_entry = tk.Entry(form_frame, textvariable=content_var, font=font_content)
             content_entry.pack(fill="x", pady=(0, 10))
             
             # 启用开关
             enabled_var = tk.BooleanVar(value=True)
             enabled_check = tk.Checkbutton(form_frame, text="启用此提醒",
                                          variable=enabled_var,
-                                         bg=COLORS["bg_card"], font=FONTS["content"])
+                                         bg=bg_card, font=font_content)
             enabled_check.pack(anchor="w", pady=(0, 10))
             
             # 按钮区域
-            btn_frame = tk.Frame(form_frame, bg=COLORS["bg_card"])
+            btn_frame = tk.Frame(form_frame, bg=bg_card)
             btn_frame.pack(fill="x", pady=10)
             
             def load_reminders():
-                """加载提醒列表"""
-                # 清空现有数据
-                for item in reminder_tree.get_children():
-                    reminder_tree.delete(item)
-                
-                # 添加提醒数据
+                """加载提醒列表，只更新与上次显示不同的行"""
                 custom_reminders = self.data.get("custom_reminders", [])
-                
+                rows = []
                 for i, reminder in enumerate(custom_reminders):
-                    time_str = reminder.get("time", "")
-                    content = reminder.get("content", "")
-                    enabled = reminder.get("enabled", True)
-                    date_type = reminder.get("date_type", "daily")
-                    specific_date = reminder.get("specific_date", "")
+                    time_str, content, enabled, date_type, specific_date = _reminder_fields(reminder)
                     
                     # 显示日期
                     if date_type == "daily":
@@ -3038,13 +3064,22 @@ class DailyReminderApp:
                     
                     status = "✅ 启用" if enabled else "❌ 禁用"
                     
-                    reminder_tree.insert("", "end", iid=str(i), values=(date_display, time_str, content, status))
+                    rows.append((str(i), (date_display, time_str, content, status)))
+                _fill_tree(reminder_tree, rows)
+                # 行 iid -> 提醒下标，选择事件直接查表
+                reminder_tree._iid_to_index = {iid: i for i, (iid, _) in enumerate(rows)}
             
             def add_reminder():
                 """添加或更新提醒"""
-                # 从时间轴获取时间
-                hour = hour_var.get()
-                minute = minute_var.get()
+                # 从时、分输入框获取时间（可手动输入，需校验）
+                try:
+                    hour = hour_var.get()
+                    minute = minute_var.get()
+                except tk.TclError:
+                    hour = minute = -1
+                if not (0 <= hour <= 23 and 0 <= minute <= 59):
+                    messagebox.showerror("错误", "请输入有效的时间（时 0-23，分 0-59）")
+                    return
                 time_str = f"{hour:02d}:{minute:02d}"
                 content = content_var.get().strip()
                 enabled = enabled_var.get()
@@ -3058,15 +3093,15 @@ class DailyReminderApp:
                 specific_date = ""
                 if date_type == "specific":
                     try:
+                        specific_date_widget = get_specific_date()[1]
                         if CALENDAR_AVAILABLE:
                             specific_date = specific_date_widget.get_date().strftime("%Y-%m-%d")
                         else:
                             specific_date = specific_date_widget.get().strip()
                             # 验证日期格式
-                            datetime.date.fromisoformat(specific_date)
-                    except ValueError:
-                        messagebox.showerror("错误", "请输入有效的日期格式（YYYY-MM-DD）")
-                        return
+                            if _parse_user_date(specific_date) is None:
+                                messagebox.showerror("错误", "请输入有效的日期格式（YYYY-MM-DD）")
+                                return
                     except Exception as e:
                         messagebox.showerror("错误", f"日期获取失败：{e}")
                         return
@@ -3081,7 +3116,7 @@ class DailyReminderApp:
                 }
                 
                 self.data.setdefault("custom_reminders", []).append(reminder)
-                save_data(self.data)
+                self.mark_dirty()
                 load_reminders()
                 
                 # 清空输入框
@@ -3090,10 +3125,10 @@ class DailyReminderApp:
                 content_var.set("")
                 enabled_var.set(True)
                 date_type_var.set("daily")
-                specific_date_frame.pack_forget()
+                hide_specific_date()
                 
-                # 重新安排提醒
-                self.schedule_custom_reminders()
+                # 重新安排提醒（与写盘一样延迟合并）
+                self._request_reschedule()
                 messagebox.showinfo("成功", f"提醒 '{content}' 已添加！")
             
             def delete_reminder():
@@ -3103,27 +3138,26 @@ class DailyReminderApp:
                     messagebox.showwarning("提示", "请选择要删除的提醒")
                     return
                 
-                item_id = selection[0]
+                index = reminder_tree._iid_to_index.get(selection[0])
                 try:
-                    index = int(item_id)
                     custom_reminders = self.data.get("custom_reminders", [])
                     
-                    if 0 <= index < len(custom_reminders):
+                    if index is not None and index < len(custom_reminders):
                         reminder = custom_reminders[index]
-                        content = reminder.get("content", "")
+                        content = reminder["content"]
                         
                         if messagebox.askyesno("确认删除", f"确定要删除提醒 '{content}' 吗？"):
                             del custom_reminders[index]
-                            save_data(self.data)
+                            self.mark_dirty()
                             load_reminders()
                             hour_var.set(9)
                             minute_var.set(0)
                             content_var.set("")
                             enabled_var.set(True)
                             date_type_var.set("daily")
-                            specific_date_frame.pack_forget()
-                            # 重新安排提醒
-                            self.schedule_custom_reminders()
+                            hide_specific_date()
+                            # 重新安排提醒（与写盘一样延迟合并）
+                            self._request_reschedule()
                             messagebox.showinfo("成功", f"提醒 '{content}' 已删除！")
                 except (ValueError, IndexError):
                     messagebox.showerror("错误", "删除失败，请重试")
@@ -3135,20 +3169,18 @@ class DailyReminderApp:
                     messagebox.showwarning("提示", "请选择要切换状态的提醒")
                     return
                 
-                item_id = selection[0]
+                index = reminder_tree._iid_to_index.get(selection[0])
                 try:
-                    index = int(item_id)
                     custom_reminders = self.data.get("custom_reminders", [])
                     
-                    if 0 <= index < len(custom_reminders):
+                    if index is not None and index < len(custom_reminders):
                         reminder = custom_reminders[index]
-                        current_status = reminder.get("enabled", True)
-                        reminder["enabled"] = not current_status
+                        reminder["enabled"] = not reminder["enabled"]
                         
-                        save_data(self.data)
+                        self.mark_dirty()
                         load_reminders()
-                        # 重新安排提醒
-                        self.schedule_custom_reminders()
+                        # 重新安排提醒（与写盘一样延迟合并）
+                        self._request_reschedule()
                         
                         status_text = "启用" if reminder["enabled"] else "禁用"
                         messagebox.showinfo("状态更新", f"提醒状态已更新为: {status_text}")
@@ -3178,7 +3210,7 @@ class DailyReminderApp:
             
             # 绑定事件
             reminder_tree.bind("<<TreeviewSelect>>", 
-                             lambda e: self.on_reminder_select(reminder_tree, hour_var, minute_var, content_var, enabled_var, date_type_var, specific_date_widget, specific_date_frame))
+                             lambda e: self.on_reminder_select(reminder_tree, hour_var, minute_var, content_var, enabled_var, date_type_var, get_specific_date))
             reminder_tree.bind("<Double-1>", lambda e: toggle_reminder())
             
             # 初始加载提醒列表
@@ -3188,16 +3220,15 @@ class DailyReminderApp:
             logging.error(f"Failed to open custom reminder settings: {e}")
             messagebox.showerror("错误", f"打开自定义提醒设置窗口失败：{e}")
     
-    def on_reminder_select(self, tree, hour_var, minute_var, content_var, enabled_var, date_type_var, specific_date_widget, specific_date_frame):
-        """选择提醒时的事件处理"""
+    def on_reminder_select(self, tree, hour_var, minute_var, content_var, enabled_var, date_type_var, get_specific_date):
+        """选择提醒时的事件处理；get_specific_date 按需创建并返回 (特定日期框架, 日期控件)"""
         selection = tree.selection()
         if selection:
-            item_id = selection[0]
+            index = getattr(tree, "_iid_to_index", {}).get(selection[0])
             try:
-                index = int(item_id)
                 custom_reminders = self.data.get("custom_reminders", [])
                 
-                if 0 <= index < len(custom_reminders):
+                if index is not None and index < len(custom_reminders):
                     reminder = custom_reminders[index]
                     time_str = reminder.get("time", "09:00")
                     
@@ -3218,36 +3249,48 @@ class DailyReminderApp:
                     date_type_var.set(date_type)
                     
                     if date_type == "specific":
+                        specific_date_frame, specific_date_widget = get_specific_date()
                         specific_date = reminder.get("specific_date", "")
                         if specific_date:
-                            try:
-                                if CALENDAR_AVAILABLE:
-                                    specific_date_widget.set_date(datetime.date.fromisoformat(specific_date))
-                                else:
-                                    specific_date_widget.delete(0, tk.END)
-                                    specific_date_widget.insert(0, specific_date)
-                            except ValueError:
-                                pass
+                            if CALENDAR_AVAILABLE:
+                                day = _parse_user_date(specific_date)
+                                if day is not None:
+                                    specific_date_widget.set_date(day)
+                            else:
+                                specific_date_widget.delete(0, tk.END)
+                                specific_date_widget.insert(0, specific_date)
                         specific_date_frame.pack(fill="x", pady=(5, 0))
                     else:
-                        specific_date_frame.pack_forget()
+                        parts = get_specific_date(create=False)
+                        if parts:
+                            parts[0].pack_forget()
                         
             except (ValueError, IndexError):
                 pass
 
-    def toggle_date_input(self, date_type_var, specific_date_frame):
-        """切换日期输入显示"""
+    def toggle_date_input(self, date_type_var, get_specific_date):
+        """切换日期输入显示，特定日期控件在第一次切换到“特定日期”时创建"""
         try:
             if date_type_var.get() == "specific":
-                specific_date_frame.pack(fill="x", pady=(5, 0))
+                get_specific_date()[0].pack(fill="x", pady=(5, 0))
             else:
-                specific_date_frame.pack_forget()
+                parts = get_specific_date(create=False)
+                if parts:
+                    parts[0].pack_forget()
         except Exception as e:
             logging.error(f"Failed to toggle date input: {e}")
 
     def open_clock_settings(self):
-        """打开上下班打卡设置窗口"""
+        """打开上下班打卡设置窗口；窗口只创建一次，之后回填当前设置并重新显示"""
         try:
+            cached = self._clock_settings_dlg
+            if cached is not None and cached[0].winfo_exists():
+                dlg, populate = cached
+                populate()
+                dlg.deiconify()
+                dlg.lift()
+                return
+            
             dlg = tk.Toplevel(self.root)
             dlg.title("⏰ 上下班打卡提醒")
             dlg.configure(bg=COLORS["bg_main"])
@@ -3265,14 +3308,12 @@ class DailyReminderApp:
             content_frame = tk.Frame(dlg, bg=COLORS["bg_main"])
             content_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
-            clock_settings = self.data.get("clock_settings", {})
-
             # 上班设置
             clock_in_frame = create_card_frame(content_frame, "🌅 上班打卡设置")
             clock_in_frame.pack(fill="x", pady=(0, 10))
 
             # 上班开关
-            clock_in_enabled_var = tk.BooleanVar(value=clock_settings.get("clock_in_enabled", False))
+            clock_in_enabled_var = tk.BooleanVar()
             clock_in_check = tk.Checkbutton(clock_in_frame, text="启用上班打卡提醒",
                                           variable=clock_in_enabled_var,
                                           bg=COLORS["bg_card"], font=FONTS["section"])
@@ -3285,7 +3326,7 @@ class DailyReminderApp:
             tk.Label(time_frame1, text="提醒时间：", bg=COLORS["bg_card"],
                      font=FONTS["content"]).pack(side="left", padx=(0, 10))
 
-            clock_in_time_var = tk.StringVar(value=clock_settings.get("clock_in_time", "09:00"))
+            clock_in_time_var = tk.StringVar()
             clock_in_time_entry = tk.Entry(time_frame1, textvariable=clock_in_time_var,
                                          font=FONTS["content"], width=10)
             clock_in_time_entry.pack(side="left", padx=(0, 20))
@@ -3300,7 +3341,7 @@ class DailyReminderApp:
             tk.Label(msg_frame1, text="提醒消息：", bg=COLORS["bg_card"],
                      font=FONTS["content"]).pack(anchor="w", pady=(0, 5))
 
-            clock_in_msg_var = tk.StringVar(value=clock_settings.get("clock_in_message", "上班时间到了，记得打卡哦！"))
+            clock_in_msg_var = tk.StringVar()
             clock_in_msg_entry = tk.Entry(msg_frame1, textvariable=clock_in_msg_var,
                                         font=FONTS["content"], width=50)
             clock_in_msg_entry.pack(fill="x")
@@ -3310,7 +3351,7 @@ class DailyReminderApp:
             clock_out_frame.pack(fill="x", pady=(0, 10))
 
             # 下班开关
-            clock_out_enabled_var = tk.BooleanVar(value=clock_settings.get("clock_out_enabled", False))
+            clock_out_enabled_var = tk.BooleanVar()
             clock_out_check = tk.Checkbutton(clock_out_frame, text="启用下班打卡提醒",
                                            variable=clock_out_enabled_var,
                                            bg=COLORS["bg_card"], font=FONTS["section"])
@@ -3323,7 +3364,7 @@ class DailyReminderApp:
             tk.Label(time_frame2, text="提醒时间：", bg=COLORS["bg_card"],
                      font=FONTS["content"]).pack(side="left", padx=(0, 10))
 
-            clock_out_time_var = tk.StringVar(value=clock_settings.get("clock_out_time", "18:00"))
+            clock_out_time_var = tk.StringVar()
             clock_out_time_entry = tk.Entry(time_frame2, textvariable=clock_out_time_var,
                                           font=FONTS["content"], width=10)
             clock_out_time_entry.pack(side="left", padx=(0, 20))
@@ -3338,11 +3379,23 @@ class DailyReminderApp:
             tk.Label(msg_frame2, text="提醒消息：", bg=COLORS["bg_card"],
                      font=FONTS["content"]).pack(anchor="w", pady=(0, 5))
 
-            clock_out_msg_var = tk.StringVar(value=clock_settings.get("clock_out_message", "下班时间到了，记得打卡哦！"))
+            clock_out_msg_var = tk.StringVar()
             clock_out_msg_entry = tk.Entry(msg_frame2, textvariable=clock_out_msg_var,
                                          font=FONTS["content"], width=50)
             clock_out_msg_entry.pack(fill="x")
 
+            def populate():
+                """用当前保存的打卡设置回填输入项"""
+                clock_settings = self.data.get("clock_settings", {})
+                clock_in_enabled_var.set(clock_settings.get("clock_in_enabled", False))
+                clock_in_time_var.set(clock_settings.get("clock_in_time", "09:00"))
+                clock_in_msg_var.set(clock_settings.get("clock_in_message", "上班时间到了，记得打卡哦！"))
+                clock_out_enabled_var.set(clock_settings.get("clock_out_enabled", False))
+                clock_out_time_var.set(clock_settings.get("clock_out_time", "18:00"))
+                clock_out_msg_var.set(clock_settings.get("clock_out_message", "下班时间到了，记得打卡哦！"))
+
+            populate()
+
             # 按钮区域 - 固定在窗口底部
             btn_frame = tk.Frame(dlg, bg=COLORS["bg_main"], height=70)
             btn_frame.pack(side="bottom", fill="x", padx=20, pady=(10, 20))
@@ -3371,13 +3424,13 @@ class DailyReminderApp:
                     self.data["clock_settings"]["clock_in_message"] = clock_in_msg_var.get()
                     self.data["clock_settings"]["clock_out_message"] = clock_out_msg_var.get()
 
-                    save_data(self.data)
+                    self.mark_dirty()
                     
                     # 重新安排提醒
                     self.schedule_clock_reminders()
                     
                     messagebox.showinfo("保存成功", "上下班打卡设置已保存！")
-                    dlg.destroy()
+                    dlg.withdraw()
                     
                 except Exception as e:
                     logging.error(f"Failed to save clock settings: {e}")
@@ -3402,13 +3455,81 @@ class DailyReminderApp:
             save_btn.pack(side="right", padx=(10, 0))
 
             # 取消按钮
-            cancel_btn = create_modern_button(btn_container, "❌ 取消", dlg.destroy, COLORS["text_secondary"])
+            cancel_btn = create_modern_button(btn_container, "❌ 取消", dlg.withdraw, COLORS["text_secondary"])
             cancel_btn.pack(side="right")
 
+            # 关闭时只隐藏窗口，下次打开直接复用
+            dlg.protocol("WM_DELETE_WINDOW", dlg.withdraw)
+            self._clock_settings_dlg = (dlg, populate)
+
         except Exception as e:
             logging.error(f"Failed to open clock settings: {e}")
             messagebox.showerror("错误", f"打开设置窗口失败：{e}")
 
+    def mark_dirty(self):
+        """标记数据已修改，在 SAVE_DELAY_MS 后合并写盘"""
+        self._dirty = True
+        self._mutation_counter += 1
+        if self._save_timer is None:
+            self._save_timer = self.root.after(SAVE_DELAY_MS, self._flush_save)
+
+    def _request_reschedule(self):
+        """自定义提醒有修改，在 SAVE_DELAY_MS 后合并为一次重新安排"""
+        if self._reschedule_timer is None:
+            self._reschedule_timer = self.root.after(SAVE_DELAY_MS, self._flush_reschedule)
+
+    def _flush_reschedule(self):
+        """执行挂起的自定义提醒重新安排"""
+        self._reschedule_timer = None
+        self.schedule_custom_reminders()
+
+    def _flush_save(self, sync=False):
+        """将挂起的修改写入磁盘，默认交给后台线程；退出前传入 sync=True 同步写入"""
+        if self._save_timer is not None:
+            try:
+                self.root.after_cancel(self._save_timer)
+            except Exception:
+                pass
+            self._save_timer = None
+        if not self._dirty:
+            return
+        self._dirty = False
+        self._save_seq += 1
+        snapshot = copy.deepcopy(self.data)
+        if sync:
+            self._write_snapshot(snapshot, self._save_seq, sync=True)
+        else:
+            threading.Thread(target=self._write_snapshot,
+                             args=(snapshot, self._save_seq), daemon=True).start()
+
+    def _write_snapshot(self, snapshot, seq, sync=False):
+        """写入数据快照，跳过已被更新快照取代的旧快照
+
+        写入失败时交回主线程处理（后台线程经 root.after 转交），由 _on_save_failed 提示并保留修改标记。
+        """
+        with _SAVE_LOCK:
+            if seq <= self._saved_seq:
+                return
+            try:
+                _write_data_file(snapshot)
+                self._saved_seq = seq
+                return
+            except Exception as e:
+                error = e
+        if sync:
+            self._on_save_failed(seq, error)
+        else:
+            try:
+                self.root.after(0, lambda: self._on_save_failed(seq, error))
+            except Exception:
+                logging.error(f"Failed to save data: {error}")
+
+    def _on_save_failed(self, seq, error):
+        """保存失败：重新标记为未保存，下次修改或退出时重试，并提示用户"""
+        if seq > self._saved_seq:
+            self._dirty = True
+        _report_save_error(error)
+
     def on_closing(self):
         """Window close handling"""
         try:
@@ -3417,10 +3538,12 @@ class DailyReminderApp:
             else:
                 result = messagebox.askyesno("退出", "确定要退出程序吗？")
                 if result:
+                    self._flush_save(sync=True)
                     self.root.destroy()
                     sys.exit(0)
         except Exception as e:
             logging.error(f"Failed to handle closing: {e}")
+            self._flush_save(sync=True)
             self.root.destroy()
             sys.exit(0)
 
@@ -3431,14 +3554,15 @@ class DailyReminderApp:
                 self.root.iconify()
                 return
             
-            self.root.withdraw()
-            image = self.create_tray_image()
+            pystray = _lazy_import("pystray")
+            image = self.create_tray_image() if pystray else None
             if image is None:
                 self.root.iconify()
                 return
             
-            menu = (item('📂 打开程序', self.on_tray_show),
-                    item('❌ 退出程序', self.on_tray_quit))
+            self.root.withdraw()
+            menu = (pystray.MenuItem('📂 打开程序', self.on_tray_show),
+                    pystray.MenuItem('❌ 退出程序', self.on_tray_quit))
             self.tray_icon_obj = pystray.Icon("每日提醒", image, "昱景每日工作提醒", menu)
             self.tray_thread = threading.Thread(target=self.tray_icon_obj.run, daemon=True)
             self.tray_thread.start()
@@ -3453,20 +3577,21 @@ class DailyReminderApp:
             return None
         
         try:
-            image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-            d = ImageDraw.Draw(image)
-            
-            d.ellipse([4, 4, size-4, size-4], fill=(33, 150, 243, 255), outline=(25, 118, 210, 255), width=2)
-            
-            d.ellipse([size/2-8, size/2-8, size/2+8, size/2+8], fill=(255, 255, 255, 255))
-            
-            return image
+            return _draw_tray_image(size)
         except Exception as e:
             logging.error(f"Failed to create tray icon: {e}")
             return None
 
     def on_tray_quit(self, icon, item):
-        """Tray quit"""
+        """Tray quit：pystray 在自己的线程中调用，退出流程转交 Tk 主线程执行"""
+        self.root.after(0, self._quit_from_tray)
+
+    def _quit_from_tray(self):
+        """在 Tk 主线程中写盘、停止托盘图标并退出"""
+        try:
+            self._flush_save(sync=True)
+        except Exception as e:
+            logging.error(f"Failed to flush data on quit: {e}")
         try:
             if self.tray_icon_obj:
                 self.tray_icon_obj.stop()
@@ -3495,28 +3620,15 @@ class DailyReminderApp:
     def run(self):
         """Run application"""
         try:
-            # 确保数据已加载
-            self.data = load_data()
-            
-            # 初始化界面显示
+            # 初始化界面显示（表格由 _initial_table_bringup 填充）
             self.update_reminder_text()
             
-            # 确保表格完全初始化后再刷新数据
-            self.root.after(500, lambda: self.refresh_order_tables(['main_shipping', 'main_pre']))
-            self.root.after(1000, lambda: self.refresh_order_tables(['main_shipping', 'main_pre']))
-            self.root.after(1500, lambda: self.refresh_order_tables(['main_shipping', 'main_pre']))
-            
-            # 确保数据被正确加载和显示
-            self.root.after(2000, self.ensure_data_loaded)
-            
             if self.data.get("reminder_enabled", True) and check_trial(self.root):
                 self.schedule_reminder()
             
-            # 启动上下班打卡提醒
-            self.schedule_clock_reminders()
-            
-            # 启动自定义提醒
-            self.schedule_custom_reminders()
+            # 启动上下班打卡提醒和自定义提醒：放到空闲时执行，不阻塞主窗口首次显示
+            self.root.after_idle(self.schedule_clock_reminders)
+            self.root.after_idle(self.schedule_custom_reminders)
             
             if self.data.get("startup_enabled", False):
                 try:
@@ -3617,8 +3729,7 @@ class DailyReminderApp:
             def load_festivals():
                 """加载节日列表"""
                 # 清空现有数据
-                for item in festival_tree.get_children():
-                    festival_tree.delete(item)
+                festival_tree.delete(*festival_tree.get_children())
                 
                 # 添加节日数据
                 today = datetime.date.today()
@@ -3670,7 +3781,7 @@ class DailyReminderApp:
                 
                 # 添加或更新节日
                 self.data.setdefault("festival_reminders", {})[date_str] = name
-                save_data(self.data)
+                self.mark_dirty()
                 load_festivals()
                 
                 # 清空输入框
@@ -3697,7 +3808,7 @@ class DailyReminderApp:
                     if messagebox.askyesno("确认删除", f"确定要删除节日 '{name}' ({date_str}) 吗？"):
                         if date_str in self.data.get("festival_reminders", {}):
                             del self.data["festival_reminders"][date_str]
-                            save_data(self.data)
+                            self.mark_dirty()
                             load_festivals()
                             date_var.set("")
                             name_var.set("")
@@ -3763,7 +3874,7 @@ class DailyReminderApp:
                             # 取消
                             return
                         
-                        save_data(self.data)
+                        self.mark_dirty()
                         load_festivals()
                         self.update_reminder_text()
                         
@@ -3843,7 +3954,7 @@ class DailyReminderApp:
         # 临时添加测试节日到数据中
         original_holidays = self.data.get("festival_reminders", {}).copy()
         self.data.setdefault("festival_reminders", {}).update(test_holidays)
-        save_data(self.data)
+        self.mark_dirty()
         
         # 更新主窗口显示
         self.update_reminder_text()
@@ -3878,7 +3989,7 @@ class DailyReminderApp:
         if not result:
             # 恢复原始节日设置
             self.data["festival_reminders"] = original_holidays
-            save_data(self.data)
+            self.mark_dirty()
             # 强制更新主窗口显示
             self.update_reminder_text()
             # 刷新节日管理窗口的列表（如果存在）
@@ -3900,7 +4011,7 @@ class DailyReminderApp:
             
             # 添加到数据中
             self.data.setdefault("festival_reminders", {}).update(test_holidays)
-            save_data(self.data)
+            self.mark_dirty()
             
             # 更新主窗口显示
             self.update_reminder_text()
@@ -3947,7 +4058,7 @@ class DailyReminderApp:
                     if date_str in self.data.get("festival_reminders", {}):
                         del self.data["festival_reminders"][date_str]
                 
-                save_data(self.data)
+                self.mark_dirty()
                 
                 # 更新主窗口显示
                 self.update_reminder_text()
@@ -3986,8 +4097,7 @@ class DailyReminderApp:
                 return
                 
             # 清空现有数据
-            for item in tree_widget.get_children():
-                tree_widget.delete(item)
+            tree_widget.delete(*tree_widget.get_children())
             
             # 添加节日数据
             today = datetime.date.today()